@@ -22,13 +22,44 @@ class Settings(BaseSettings):
     Attributes:
         ollama_host: URL endpoint for the Ollama service
         ollama_model: Name of the LLM model to use (e.g., 'mistral', 'llama3.2:1b')
+        ollama_max_concurrent_generations: Maximum in-flight generation requests to Ollama
+        ollama_max_concurrent_embeddings: Maximum in-flight embedding requests to Ollama
         chroma_persist_directory: Local directory path for ChromaDB persistence
         chroma_collection_name: Name of the ChromaDB collection for document storage
+        chroma_similarity_metric: HNSW distance space for new collections
+        chroma_hnsw_m: HNSW graph links per node for new collections
+        chroma_hnsw_construction_ef: HNSW candidate list size while indexing
+        chroma_hnsw_search_ef: HNSW candidate list size while querying
         host: Server host address (use '0.0.0.0' for external access)
         port: Server port number
+        workers: Number of uvicorn worker processes
+        access_log: Whether uvicorn writes a log line per request
+        limit_concurrency: Maximum concurrent connections before uvicorn returns 503
+        timeout_keep_alive: Seconds an idle keep-alive connection is held open
+        blocking_io_workers: Size of the thread pool for blocking ChromaDB calls
+        gzip_minimum_size: Smallest response body in bytes that is gzip-compressed
+        max_request_body_bytes: Largest accepted gzip request body, before and after decompression
         rate_limit: Maximum API requests per minute per IP address
         enable_cache: Whether to enable response caching
         cache_size: Maximum number of cached items
+        embedding_cache_ttl: Seconds a cached embedding stays valid
+        semantic_cache_threshold: Minimum cosine similarity for a semantic cache hit
+        embed_batch_max_size: Maximum number of single-text embeddings coalesced into one Ollama call
+        embed_batch_max_wait_ms: Maximum time to wait for an embedding batch to fill
+        health_cache_ttl: Seconds to cache health and statistics backend checks
+        warmup_on_startup: Whether to load models and index pages before serving requests
+        num_results: Number of results to return for similarity searches
+        summary_min_words: Texts with at most this many words are returned unsummarized
+        max_context_tokens: Estimated prompt plus completion token budget per LLM request
+        enable_query_enhancement: Whether to expand search queries with the LLM
+        query_enhancement_min_words: Queries with fewer words are searched as-is
+        query_enhancement_max_chars: Queries with more characters are searched as-is
+        query_enhancement_timeout_ms: Longest a search waits for its query enhancement
+        search_early_exit_distance: Top-result distance below which query enhancement is skipped
+        search_exact_rerank: Whether to re-score approximate search candidates exactly
+        search_overfetch_factor: Candidates fetched per search result before deduplicating by file
+        search_cache_size: Maximum number of cached search results (0 disables)
+        search_cache_threshold: Minimum query cosine similarity to reuse a cached search result
     """
 
     # Ollama Configuration
@@ -40,6 +71,18 @@ class Settings(BaseSettings):
         default="mistral",
         description="LLM model name (e.g., 'mistral', 'llama3.2:1b', 'llama3.2:3b')"
     )
+    ollama_max_concurrent_generations: int = Field(
+        default=4,
+        ge=0,
+        le=256,
+        description="Maximum in-flight generation requests to Ollama; excess requests queue (0 = unlimited)"
+    )
+    ollama_max_concurrent_embeddings: int = Field(
+        default=8,
+        ge=0,
+        le=256,
+        description="Maximum in-flight embedding requests to Ollama; excess requests queue (0 = unlimited)"
+    )
     
     # ChromaDB Configuration
     chroma_persist_directory: str = Field(
@@ -50,6 +93,29 @@ class Settings(BaseSettings):
         default="documents",
         description="ChromaDB collection name for document embeddings"
     )
+    chroma_similarity_metric: str = Field(
+        default="cosine",
+        pattern="^(cosine|ip)$",
+        description="HNSW distance space for new collections ('cosine' or 'ip')"
+    )
+    chroma_hnsw_m: int = Field(
+        default=16,
+        ge=2,
+        le=128,
+        description="HNSW graph links per node for new collections (higher = better recall, more memory)"
+    )
+    chroma_hnsw_construction_ef: int = Field(
+        default=200,
+        ge=1,
+        le=2000,
+        description="HNSW candidate list size while building the index of new collections"
+    )
+    chroma_hnsw_search_ef: int = Field(
+        default=100,
+        ge=1,
+        le=2000,
+        description="HNSW candidate list size while querying new collections"
+    )
     
     # Server Configuration
     host: str = Field(
@@ -62,6 +128,46 @@ class Settings(BaseSettings):
         le=65535,
         description="Server port number (1024-65535)"
     )
+    workers: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Number of uvicorn worker processes"
+    )
+    access_log: bool = Field(
+        default=False,
+        description="Enable uvicorn per-request access logging"
+    )
+    limit_concurrency: int = Field(
+        default=1000,
+        ge=0,
+        le=100000,
+        description="Maximum concurrent connections per worker before returning 503 (0 = unlimited)"
+    )
+    timeout_keep_alive: int = Field(
+        default=30,
+        ge=1,
+        le=600,
+        description="Seconds to keep idle keep-alive connections open"
+    )
+    blocking_io_workers: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Thread pool size for blocking ChromaDB calls"
+    )
+    gzip_minimum_size: int = Field(
+        default=1024,
+        ge=0,
+        le=10485760,
+        description="Compress responses of at least this many bytes when the client accepts gzip (0 = disabled)"
+    )
+    max_request_body_bytes: int = Field(
+        default=16777216,
+        ge=1024,
+        le=1073741824,
+        description="Maximum size of a gzip-encoded request body, compressed and decompressed"
+    )
     
     # Performance Configuration
     rate_limit: int = Field(
@@ -80,6 +186,40 @@ class Settings(BaseSettings):
         le=100000,
         description="Maximum number of cached items"
     )
+    embedding_cache_ttl: float = Field(
+        default=3600.0,
+        ge=0.0,
+        le=604800.0,
+        description="Seconds a cached embedding stays valid (0 = no expiry)"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for a semantic cache hit"
+    )
+    embed_batch_max_size: int = Field(
+        default=32,
+        ge=1,
+        le=256,
+        description="Maximum number of /embed and /documents embeddings coalesced into one Ollama call (1 disables batching)"
+    )
+    embed_batch_max_wait_ms: float = Field(
+        default=10.0,
+        ge=0.0,
+        le=1000.0,
+        description="Maximum time in milliseconds to wait for an embedding batch to fill"
+    )
+    health_cache_ttl: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=60.0,
+        description="Seconds to cache Ollama availability and ChromaDB stats for health checks"
+    )
+    warmup_on_startup: bool = Field(
+        default=True,
+        description="Send throwaway generation, embedding and search calls at startup"
+    )
 
     # ChromaDB Search Configuration
     num_results: int = Field(
@@ -88,6 +228,70 @@ class Settings(BaseSettings):
         le=50,
         description="Number of results to return for similarity searches"
     )
+    enable_query_enhancement: bool = Field(
+        default=True,
+        description="Expand search queries with the LLM before searching (disable if insufficient resources)"
+    )
+    query_enhancement_min_words: int = Field(
+        default=4,
+        ge=0,
+        le=100,
+        description="Skip query enhancement for queries with fewer words"
+    )
+    query_enhancement_max_chars: int = Field(
+        default=200,
+        ge=1,
+        le=10000,
+        description="Skip query enhancement for queries longer than this many characters"
+    )
+    query_enhancement_timeout_ms: float = Field(
+        default=3000.0,
+        ge=0.0,
+        le=120000.0,
+        description="Use the original query if its enhancement takes longer than this (0 = wait indefinitely)"
+    )
+    search_early_exit_distance: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=2.0,
+        description="Skip query enhancement when the top result distance is at or below this value"
+    )
+    search_exact_rerank: bool = Field(
+        default=False,
+        description="Re-score over-fetched HNSW candidates with exact cosine distances"
+    )
+    search_overfetch_factor: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Candidates fetched per result before keeping the best chunk per file (1 = one document per file)"
+    )
+    search_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        le=100000,
+        description="Maximum number of unfiltered search results cached by query embedding (0 = disabled)"
+    )
+    search_cache_threshold: float = Field(
+        default=0.98,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity between queries to reuse a cached search result"
+    )
+
+    # Summarization Configuration
+    summary_min_words: int = Field(
+        default=50,
+        ge=0,
+        le=10000,
+        description="Return texts of at most this many words as their own summary (0 disables)"
+    )
+    max_context_tokens: int = Field(
+        default=8192,
+        ge=256,
+        le=131072,
+        description="Reject LLM requests whose estimated prompt plus max_tokens exceeds this many tokens"
+    )
 
     # Pydantic Settings Configuration
     model_config = SettingsConfigDict(
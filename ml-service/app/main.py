@@ -7,27 +7,59 @@ embedding generation, and vector-based document search using Ollama and ChromaDB
 The service offers the following capabilities:
 - Text generation using LLMs via Ollama
 - Document summarization with configurable parameters
+- Token streaming of generations and summaries as server-sent events
 - Text embedding generation for semantic search
-- Vector-based document storage and retrieval
+- Vector-based document storage and retrieval (single and batched)
 - Semantic search with query enhancement
 """
 
+import asyncio
+import atexit
+import base64
+import functools
+import itertools
 import time
 import logging
-from typing import List, Dict, Any, Optional
-
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+import queue
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from typing import AsyncIterator, Callable, List, Dict, Any, Literal, Optional, Tuple, TypeVar
+
+import httpx
+import numpy as np
+import orjson
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing_extensions import Annotated
 
 from app.config import settings
+from app.middleware import GZipRequestMiddleware, GZipResponseMiddleware
 from services.chroma_service import ChromaService
+from services.micro_batcher import MicroBatcher
 from services.ollama_service import OllamaService
+from services.semantic_cache import SemanticCache
+from services.ttl_cache import async_ttl_cache
+
+# Configure logging: request handlers only enqueue records, a background
+# listener thread formats them and writes to stderr
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(
+    logging.Formatter(
+        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+)
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
-# Configure logging
+# QueueHandler renders only the message; the listener applies the full format
 logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+    level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
@@ -38,19 +70,97 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
+# Accept gzip-compressed request bodies (e.g. large /documents/batch payloads)
+app.add_middleware(GZipRequestMiddleware, max_body_size=settings.max_request_body_bytes)
+
+# Compress large responses such as search results; level 6 keeps CPU cost low
+if settings.gzip_minimum_size:
+    app.add_middleware(
+        GZipResponseMiddleware, minimum_size=settings.gzip_minimum_size, compresslevel=6
+    )
+
 # Initialize services as singletons
 ollama_service = OllamaService(
-    host=settings.ollama_host, model=settings.ollama_model
+    host=settings.ollama_host,
+    model=settings.ollama_model,
+    embedding_cache_size=settings.cache_size if settings.enable_cache else 0,
+    embedding_cache_ttl=settings.embedding_cache_ttl,
+    max_concurrent_generations=settings.ollama_max_concurrent_generations,
+    max_concurrent_embeddings=settings.ollama_max_concurrent_embeddings,
+)
+
+# Opened on startup rather than at import, so importing this module twice
+# (as __main__ and again by uvicorn) does not open the database twice
+chroma_service: ChromaService
+
+# Coalesces concurrent /embed, /search and /documents embeddings into batched
+# Ollama calls
+embedding_batcher: MicroBatcher[str, List[float]] = MicroBatcher(
+    ollama_service.aembed_texts,
+    max_batch_size=settings.embed_batch_max_size,
+    max_wait_ms=settings.embed_batch_max_wait_ms,
+)
+
+# Bounded pool for blocking ChromaDB calls, so they do not
+# stall the event loop or grow the default executor without limit
+blocking_executor = ThreadPoolExecutor(
+    max_workers=settings.blocking_io_workers,
+    thread_name_prefix="ml-service-io",
 )
 
-chroma_service = ChromaService(
-    persist_directory=settings.chroma_persist_directory,
-    collection_name=settings.chroma_collection_name,
-    num_results=settings.num_results
+# Enhanced search queries keyed by original query embedding
+enhancement_cache = (
+    SemanticCache(
+        max_size=settings.cache_size,
+        threshold=settings.semantic_cache_threshold,
+    )
+    if settings.enable_cache
+    else None
 )
 
+# ============================================================================
+# Prompt Templates
+# ============================================================================
+
+SUMMARY_PROMPT_TEMPLATE = "Summarize the following document:\n\n{text}\n\nSummary:"
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a professional document summarizer. Create a concise, "
+    "clear summary in 50 words that captures the purpose of the document "
+    "and its main points. DO NOT EXCEED 50 WORDS."
+)
+
+ENHANCE_PROMPT_TEMPLATE = """Original search query: "{query}"
+
+Expand this query by:
+1. Adding relevant synonyms and related terms
+2. Including technical terminology if applicable
+3. Clarifying ambiguous terms
+4. Keeping the core intent
+
+Provide ONLY the enhanced query, no explanations."""
+
+ENHANCE_SYSTEM_PROMPT = (
+    "You are a search query optimizer. Expand queries to improve "
+    "semantic search results while preserving the original intent. "
+    "Output only the enhanced query text."
+)
+
+# Background ingestion jobs by job ID, oldest first
+ingestion_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Maximum number of ingestion jobs whose status is kept
+MAX_TRACKED_JOBS = 1000
+
+# Documents embedded and stored per slice during batch ingestion
+INGEST_BATCH_SIZE = 64
+
+# Rough characters-per-token ratio of LLM tokenizers on English text
+CHARS_PER_TOKEN = 4
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -59,6 +169,8 @@ chroma_service = ChromaService(
 class GenerationRequest(BaseModel):
     """Request model for text generation."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     prompt: str = Field(
         ..., min_length=1, max_length=10000, description="Input prompt for text generation"
     )
@@ -89,6 +201,8 @@ class GenerationResponse(BaseModel):
 class EmbeddingRequest(BaseModel):
     """Request model for embedding generation."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     text: str = Field(
         ..., min_length=1, max_length=50000, description="Text to generate embedding for"
     )
@@ -97,14 +211,41 @@ class EmbeddingRequest(BaseModel):
 class EmbeddingResponse(BaseModel):
     """Response model for embedding generation."""
 
-    embedding: List[float] = Field(..., description="Generated embedding vector")
+    embedding: Optional[List[float]] = Field(
+        None, description="Generated embedding vector (format=json)"
+    )
+    embedding_b64: Optional[str] = Field(
+        None, description="Base64 little-endian FP16 embedding bytes (format=float16)"
+    )
+    dtype: str = Field(default="float32", description="Element type of the embedding")
     dimension: int = Field(..., description="Dimensionality of the embedding")
     processing_time: float = Field(..., description="Processing time in seconds")
 
 
+class BatchEmbeddingRequest(BaseModel):
+    """Request model for batched embedding generation."""
+
+    texts: List[Annotated[str, Field(min_length=1, max_length=50000)]] = Field(
+        ..., min_length=1, max_length=256, description="Texts to generate embeddings for"
+    )
+
+
+class BatchEmbeddingResponse(BaseModel):
+    """Response model for batched embedding generation."""
+
+    embeddings: List[List[float]] = Field(
+        ..., description="Generated embedding vectors, in request order"
+    )
+    dimension: int = Field(..., description="Dimensionality of the embeddings")
+    count: int = Field(..., description="Number of embeddings generated")
+    processing_time: float = Field(..., description="Processing time in seconds")
+
+
 class SummarizationRequest(BaseModel):
     """Request model for text summarization."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     text: str = Field(
         ..., min_length=1, max_length=100000, description="Text to summarize"
     )
@@ -137,24 +278,48 @@ class SummarizationResponse(BaseModel):
 class SearchRequest(BaseModel):
     """Request model for semantic search."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     query: str = Field(
-        ..., min_length=1, max_length=1000, description="Search query"
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Search query",
     )
     filters: Optional[Dict[str, Any]] = Field(
         None, description="Optional metadata filters"
     )
 
+    @field_validator("query")
+    @classmethod
+    def query_has_words(cls, query: str) -> str:
+        """Reject queries that normalize to an empty string."""
+        # Same whitespace definition as _normalize_query (str.split)
+        if not query.split():
+            raise ValueError("query must contain at least one non-whitespace character")
+        return query
+
+
+class SearchHit(BaseModel):
+    """Single semantic search result."""
+
+    document: str = Field(..., description="Matching document text")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Document metadata")
+    distance: float = Field(..., description="Distance to the query (lower is more similar)")
+
 
 class SearchResponse(BaseModel):
     """Response model for semantic search."""
 
-    results: List[Dict[str, Any]] = Field(..., description="Search results")
+    results: List[SearchHit] = Field(..., description="Search results")
     processing_time: float = Field(..., description="Processing time in seconds")
 
 
 class DocumentRequest(BaseModel):
     """Request model for adding documents."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     document_id: str = Field(
         ..., min_length=1, max_length=255, description="Unique document identifier"
     )
@@ -172,6 +337,67 @@ class DocumentResponse(BaseModel):
     processing_time: float = Field(..., description="Processing time in seconds")
 
 
+class BatchDocumentRequest(BaseModel):
+    """Request model for adding multiple documents."""
+
+    documents: List[DocumentRequest] = Field(
+        ..., min_length=1, max_length=256, description="Documents to add"
+    )
+
+    @field_validator("documents")
+    @classmethod
+    def document_ids_are_unique(
+        cls, documents: List[DocumentRequest]
+    ) -> List[DocumentRequest]:
+        """Reject batches that repeat a document ID, which Chroma cannot upsert."""
+        seen = set()
+        duplicates = set()
+        for document in documents:
+            if document.document_id in seen:
+                duplicates.add(document.document_id)
+            seen.add(document.document_id)
+
+        if duplicates:
+            raise ValueError(
+                f"duplicate document_id values: {', '.join(sorted(duplicates))}"
+            )
+        return documents
+
+
+class BatchDocumentResponse(BaseModel):
+    """Response model for batched document operations."""
+
+    document_ids: List[str] = Field(..., description="Identifiers of added documents")
+    unchanged_ids: List[str] = Field(
+        default_factory=list,
+        description="Identifiers of documents already stored unchanged (not re-embedded)",
+    )
+    status: str = Field(..., description="Operation status")
+    count: int = Field(..., description="Number of documents added")
+    processing_time: float = Field(..., description="Processing time in seconds")
+
+
+class IngestionJobResponse(BaseModel):
+    """Response model for background document ingestion jobs."""
+
+    job_id: str = Field(..., description="Job identifier")
+    status: Literal["pending", "running", "success", "unchanged", "failed"] = Field(
+        ..., description="Job status"
+    )
+    document_ids: List[str] = Field(
+        default_factory=list, description="Identifiers of added documents"
+    )
+    unchanged_ids: List[str] = Field(
+        default_factory=list,
+        description="Identifiers of documents already stored unchanged (not re-embedded)",
+    )
+    count: int = Field(default=0, description="Number of documents added")
+    error: Optional[str] = Field(None, description="Failure reason, if any")
+    processing_time: Optional[float] = Field(
+        None, description="Processing time in seconds, once finished"
+    )
+
+
 class HealthCheckResponse(BaseModel):
     """Response model for health check endpoint."""
 
@@ -191,12 +417,32 @@ async def startup_event() -> None:
     """
     Initialize services on application startup.
 
-    Checks Ollama service availability and logs initialization status.
+    Opens ChromaDB, checks Ollama service availability, warms up the
+    models, starts the embedding micro-batcher and logs initialization
+    status.
     """
+    global chroma_service
+
     logger.info("Starting ML Service...")
 
+    chroma_service = await _run_blocking(
+        ChromaService,
+        persist_directory=settings.chroma_persist_directory,
+        collection_name=settings.chroma_collection_name,
+        num_results=settings.num_results,
+        similarity_metric=settings.chroma_similarity_metric,
+        hnsw_m=settings.chroma_hnsw_m,
+        hnsw_construction_ef=settings.chroma_hnsw_construction_ef,
+        hnsw_search_ef=settings.chroma_hnsw_search_ef,
+        exact_rerank=settings.search_exact_rerank,
+        overfetch_factor=settings.search_overfetch_factor,
+        result_cache_size=settings.search_cache_size if settings.enable_cache else 0,
+        result_cache_threshold=settings.search_cache_threshold,
+    )
+    logger.info("ChromaDB service initialized")
+
     # Verify Ollama availability
-    if not ollama_service.is_available():
+    if not await ollama_service.ais_available():
         logger.warning(
             "Ollama service is not available. "
             "Please ensure Ollama is running on %s",
@@ -204,15 +450,20 @@ async def startup_event() -> None:
         )
     else:
         logger.info("Ollama service is ready (model: %s)", settings.ollama_model)
+        if settings.warmup_on_startup:
+            await _warm_up()
+
+    embedding_batcher.start()
 
-    logger.info("ChromaDB service initialized")
     logger.info("ML Service is ready to accept requests")
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     """Clean up resources on application shutdown."""
     logger.info("Shutting down ML Service...")
-    # Add any cleanup logic here for future development
+    await embedding_batcher.stop()
+    await ollama_service.aclose()
+    blocking_executor.shutdown(wait=True)
 
 
 # ============================================================================
@@ -236,8 +487,8 @@ async def health_check() -> HealthCheckResponse:
     return HealthCheckResponse(
         status="healthy",
         service="ML Service",
-        ollama_available=ollama_service.is_available(),
-        chroma_stats=chroma_service.get_collection_stats(),
+        ollama_available=await _cached_ollama_available(),
+        chroma_stats=await _cached_chroma_stats(),
     )
 
 
@@ -253,7 +504,8 @@ async def generate_text(request: GenerationRequest) -> GenerationResponse:
         Generated text and processing metrics.
 
     Raises:
-        HTTPException: If generation fails.
+        HTTPException: If generation fails, or 413 if the prompt exceeds
+            the token budget.
 
     Example:
         ```json
@@ -265,16 +517,20 @@ async def generate_text(request: GenerationRequest) -> GenerationResponse:
         ```
     """
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        _check_token_budget(
+            request.max_tokens, request.prompt, request.system_prompt or ""
+        )
 
-        result = ollama_service.generate(
+        result = await ollama_service.agenerate(
             prompt=request.prompt,
             system_prompt=request.system_prompt,
             temperature=request.temperature,
             max_tokens=request.max_tokens,
         )
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         logger.info(
             "Generated text in %.2fs (length: %d chars)",
             processing_time,
@@ -283,20 +539,75 @@ async def generate_text(request: GenerationRequest) -> GenerationResponse:
 
         return GenerationResponse(text=result, processing_time=processing_time)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Generation error: %s", str(e), exc_info=True)
+        _invalidate_on_transport_error(e)
         raise HTTPException(
             status_code=500, detail=f"Generation failed: {str(e)}"
         ) from e
 
 
+@app.post("/generate/stream")
+async def stream_text(request: GenerationRequest) -> StreamingResponse:
+    """
+    Stream generated text as server-sent events.
+
+    Each event carries a ``{"token": ...}`` fragment as soon as Ollama
+    produces it; a final ``{"done": true, ...}`` event reports timing.
+    Failures after the stream has started are sent as an ``error`` event.
+
+    Args:
+        request: Generation request with prompt and parameters.
+
+    Returns:
+        Event stream of generated tokens.
+
+    Raises:
+        HTTPException: 413 if the prompt exceeds the token budget.
+
+    Example:
+        ```bash
+        curl -N -X POST http://localhost:8000/generate/stream \\
+            -H "Content-Type: application/json" \\
+            -d '{"prompt": "Explain artificial intelligence in simple terms."}'
+        ```
+    """
+    _check_token_budget(
+        request.max_tokens, request.prompt, request.system_prompt or ""
+    )
+
+    return StreamingResponse(
+        _stream_completion(
+            prompt=request.prompt,
+            system_prompt=request.system_prompt,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+            operation="Generation",
+            build_summary=lambda text: {},
+        ),
+        media_type="text/event-stream",
+    )
+
+
 @app.post("/embed", response_model=EmbeddingResponse)
-async def embed_text(request: EmbeddingRequest) -> EmbeddingResponse:
+async def embed_text(
+    request: EmbeddingRequest,
+    format: Literal["json", "float16"] = Query(
+        default="json", description="Embedding encoding: JSON floats or base64 FP16"
+    ),
+) -> ORJSONResponse:
     """
     Generate text embedding vector.
 
+    Concurrent requests are coalesced into batched Ollama calls. With
+    ``format=float16`` the vector is returned as base64-encoded little-endian
+    FP16 bytes in ``embedding_b64`` instead of a float array.
+
     Args:
         request: Embedding request with text.
+        format: Response encoding of the embedding.
 
     Returns:
         Embedding vector and metadata.
@@ -312,10 +623,10 @@ async def embed_text(request: EmbeddingRequest) -> EmbeddingResponse:
         ```
     """
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        embedding = ollama_service.embed_text(request.text)
-        processing_time = time.time() - start_time
+        embedding = await embedding_batcher.submit(request.text)
+        processing_time = time.perf_counter() - start_time
 
         logger.info(
             "Generated embedding in %.2fs (dimension: %d)",
@@ -323,11 +634,22 @@ async def embed_text(request: EmbeddingRequest) -> EmbeddingResponse:
             len(embedding),
         )
 
-        return EmbeddingResponse(
-            embedding=embedding,
-            dimension=len(embedding),
-            processing_time=processing_time,
-        )
+        # Return the payload directly: re-validating the response model would
+        # type-check every float of the vector on each request
+        if format == "float16":
+            return ORJSONResponse({
+                "embedding_b64": _encode_float16(embedding),
+                "dtype": "float16",
+                "dimension": len(embedding),
+                "processing_time": processing_time,
+            })
+
+        return ORJSONResponse({
+            "embedding": embedding,
+            "dtype": "float32",
+            "dimension": len(embedding),
+            "processing_time": processing_time,
+        })
 
     except Exception as e:
         logger.error("Embedding error: %s", str(e), exc_info=True)
@@ -335,14 +657,65 @@ async def embed_text(request: EmbeddingRequest) -> EmbeddingResponse:
             status_code=500, detail=f"Embedding failed: {str(e)}"
         ) from e
 
-    
+
+
+@app.post("/embed/batch", response_model=BatchEmbeddingResponse)
+async def embed_texts(request: BatchEmbeddingRequest) -> ORJSONResponse:
+    """
+    Generate embedding vectors for multiple texts in one request.
+
+    Texts are embedded with a single batched call to Ollama instead of one
+    call per text.
+
+    Args:
+        request: Batch embedding request with texts.
+
+    Returns:
+        Embedding vectors in request order and metadata.
+
+    Raises:
+        HTTPException: If embedding generation fails.
+
+    Example:
+        ```json
+        {
+            "texts": ["Machine learning is a subset of AI", "Vectors enable search"]
+        }
+        ```
+    """
+    try:
+        start_time = time.perf_counter()
+
+        embeddings = await ollama_service.aembed_texts(request.texts)
+        processing_time = time.perf_counter() - start_time
+
+        logger.info(
+            "Generated %d embeddings in %.2fs", len(embeddings), processing_time
+        )
+
+        # Skip response validation for the same reason as /embed
+        return ORJSONResponse({
+            "embeddings": embeddings,
+            "dimension": len(embeddings[0]),
+            "count": len(embeddings),
+            "processing_time": processing_time,
+        })
+
+    except Exception as e:
+        logger.error("Batch embedding error: %s", str(e), exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Batch embedding failed: {str(e)}"
+        ) from e
+
+
 @app.post("/summarize", response_model=SummarizationResponse)
 async def summarize_text(request: SummarizationRequest) -> SummarizationResponse:
     """
     Summarize text using Ollama LLM.
 
     Creates a concise summary while preserving key information.
-    Configured to generate summaries under 50 words.
+    Configured to generate summaries under 50 words. Texts that are already
+    within ``summary_min_words`` are returned as-is without calling the LLM.
 
     Args:
         request: Summarization request with text and parameters.
@@ -351,7 +724,8 @@ async def summarize_text(request: SummarizationRequest) -> SummarizationResponse
         Summary and compression metrics.
 
     Raises:
-        HTTPException: If summarization fails.
+        HTTPException: If summarization fails, or 413 if the text exceeds
+            the token budget.
 
     Example:
         ```json
@@ -363,31 +737,34 @@ async def summarize_text(request: SummarizationRequest) -> SummarizationResponse
         ```
     """
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
+        original_length = _word_count(request.text)
+
+        # Texts already within the summary target are their own summary
+        if _is_short_enough_to_skip_summary(original_length):
+            return SummarizationResponse(
+                summary=request.text.strip(),
+                original_length=original_length,
+                summary_length=original_length,
+                compression_ratio=1.0 if original_length > 0 else 0.0,
+                processing_time=time.perf_counter() - start_time,
+            )
 
-        # Construct summarization prompt
-        prompt = (
-            f"Summarize the following document:\n\n{request.text}\n\nSummary:"
-        )
-        system_prompt = (
-            "You are a professional document summarizer. Create a concise, "
-            "clear summary in 50 words that captures the purpose of the document "
-            "and its main points. DO NOT EXCEED 50 WORDS."
-        )
+        prompt = SUMMARY_PROMPT_TEMPLATE.format(text=request.text)
+        _check_token_budget(request.max_length, prompt, SUMMARY_SYSTEM_PROMPT)
 
         # Generate summary
-        summary = ollama_service.generate(
+        summary = await ollama_service.agenerate(
             prompt=prompt,
-            system_prompt=system_prompt,
+            system_prompt=SUMMARY_SYSTEM_PROMPT,
             temperature=request.temperature,
             max_tokens=request.max_length,
         )
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         # Calculate compression metrics
-        original_length = len(request.text.split())
-        summary_length = len(summary.split())
+        summary_length = _word_count(summary)
         compression_ratio = (
             summary_length / original_length if original_length > 0 else 0.0
         )
@@ -406,19 +783,84 @@ async def summarize_text(request: SummarizationRequest) -> SummarizationResponse
             processing_time=processing_time,
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Summarization error: %s", str(e), exc_info=True)
+        _invalidate_on_transport_error(e)
         raise HTTPException(
             status_code=500, detail=f"Summarization failed: {str(e)}"
         ) from e
 
 
+@app.post("/summarize/stream")
+async def stream_summary(request: SummarizationRequest) -> StreamingResponse:
+    """
+    Stream a summary as server-sent events.
+
+    Emits ``{"token": ...}`` events while the summary is generated and a
+    final ``{"done": true, ...}`` event with the same metrics as
+    ``/summarize`` (lengths and compression ratio).
+
+    Args:
+        request: Summarization request with text and parameters.
+
+    Returns:
+        Event stream of summary tokens and final metrics.
+
+    Raises:
+        HTTPException: 413 if the text exceeds the token budget.
+
+    Example:
+        ```bash
+        curl -N -X POST http://localhost:8000/summarize/stream \\
+            -H "Content-Type: application/json" \\
+            -d '{"text": "Long document text..."}'
+        ```
+    """
+    original_length = _word_count(request.text)
+
+    def build_summary(summary: str) -> Dict[str, Any]:
+        summary_length = _word_count(summary)
+        return {
+            "original_length": original_length,
+            "summary_length": summary_length,
+            "compression_ratio": (
+                summary_length / original_length if original_length > 0 else 0.0
+            ),
+        }
+
+    if _is_short_enough_to_skip_summary(original_length):
+        return StreamingResponse(
+            _stream_unchanged_text(request.text.strip(), build_summary),
+            media_type="text/event-stream",
+        )
+
+    prompt = SUMMARY_PROMPT_TEMPLATE.format(text=request.text)
+    _check_token_budget(request.max_length, prompt, SUMMARY_SYSTEM_PROMPT)
+
+    return StreamingResponse(
+        _stream_completion(
+            prompt=prompt,
+            system_prompt=SUMMARY_SYSTEM_PROMPT,
+            temperature=request.temperature,
+            max_tokens=request.max_length,
+            operation="Summarization",
+            build_summary=build_summary,
+        ),
+        media_type="text/event-stream",
+    )
+
+
 @app.post("/search", response_model=SearchResponse)
 async def search_documents(request: SearchRequest) -> SearchResponse:
     """
     Perform semantic search across stored documents.
 
     Optionally enhances queries using LLM for improved search results.
+    The enhancement runs concurrently with a search for the original query
+    and is discarded when that search already has a near-exact match or
+    the enhancement misses its time budget.
 
     Args:
         request: Search request with query and parameters.
@@ -437,26 +879,44 @@ async def search_documents(request: SearchRequest) -> SearchResponse:
         }
         ```
     """
-    try:
-        start_time = time.time()
-        query_to_embed = request.query
-
-        # Query enhancement for better semantic matching
-        enable_query_enhancement = True # Disable if insufficient resources
+    # Whitespace variants share cached embeddings; case is kept for the
+    # embedding model and only ignored by the enhancement cache
+    query = _normalize_query(request.query)
+    if not query:
+        raise HTTPException(status_code=422, detail="Search query is empty")
 
-        if enable_query_enhancement:
-            query_to_embed = _enhance_search_query(request.query)
+    enhancement_task: "Optional[asyncio.Task[str]]" = None
 
-        # Generate embedding for the query
-        query_embedding = ollama_service.embed_text(query_to_embed)
+    try:
+        start_time = time.perf_counter()
+        query_embedding = await embedding_batcher.submit(query)
+
+        # Query enhancement for better semantic matching runs concurrently
+        # with the search for the original query
+        if _should_enhance_query(query):
+            enhancement_task = asyncio.create_task(
+                _enhance_search_query(query, query_embedding)
+            )
 
-        # Perform vector search
-        results = chroma_service.search_similar(
+        results = await _run_blocking(
+            chroma_service.search_similar,
             query_embedding=query_embedding,
             where=request.filters,
         )
 
-        processing_time = time.time() - start_time
+        # An unused enhancement is cancelled in the finally block below
+        if enhancement_task is not None and not _is_confident_match(results):
+            enhanced_query = await _await_enhancement(enhancement_task, query)
+
+            if enhanced_query != query:
+                query_embedding = await embedding_batcher.submit(enhanced_query)
+                results = await _run_blocking(
+                    chroma_service.search_similar,
+                    query_embedding=query_embedding,
+                    where=request.filters,
+                )
+
+        processing_time = time.perf_counter() - start_time
 
         # Format results for response
         formatted_results = _format_search_results(results)
@@ -467,7 +927,7 @@ async def search_documents(request: SearchRequest) -> SearchResponse:
             len(formatted_results),
         )
 
-        return SearchResponse(
+        return SearchResponse.model_construct(
             results=formatted_results, processing_time=processing_time
         )
 
@@ -477,13 +937,19 @@ async def search_documents(request: SearchRequest) -> SearchResponse:
             status_code=500, detail=f"Search failed: {str(e)}"
         ) from e
 
+    finally:
+        # Free the generation slot of an enhancement that will not be used
+        if enhancement_task is not None and not enhancement_task.done():
+            enhancement_task.cancel()
+
 
 @app.post("/documents", response_model=DocumentResponse)
 async def add_document(request: DocumentRequest) -> DocumentResponse:
     """
     Add document to vector database.
 
-    Generates embedding and stores document for semantic search.
+    Generates embedding and stores document for semantic search. Re-adding
+    a document with unchanged text and metadata skips embedding and storage.
 
     Args:
         request: Document request with ID, text, and metadata.
@@ -504,20 +970,40 @@ async def add_document(request: DocumentRequest) -> DocumentResponse:
         ```
     """
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
+        metadata = request.metadata or {}
+
+        # Skip re-embedding documents that are already stored unchanged
+        if await _run_blocking(
+            chroma_service.has_same_content,
+            request.document_id,
+            request.text,
+            metadata,
+        ):
+            processing_time = time.perf_counter() - start_time
+            logger.info(
+                "Document '%s' unchanged, skipped re-embedding",
+                request.document_id,
+            )
+            return DocumentResponse(
+                document_id=request.document_id,
+                status="unchanged",
+                processing_time=processing_time,
+            )
 
-        # Generate embedding for document
-        embedding = ollama_service.embed_text(request.text)
+        # Generate embedding for document, batched with concurrent requests
+        embedding = await embedding_batcher.submit(request.text)
 
         # Store in ChromaDB
-        document_id = chroma_service.add_document(
+        document_id = await _run_blocking(
+            chroma_service.add_document,
             document_id=request.document_id,
             text=request.text,
             embedding=embedding,
-            metadata=request.metadata or {},
+            metadata=metadata,
         )
 
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         logger.info(
             "Added document '%s' in %.2fs", document_id, processing_time
@@ -536,6 +1022,123 @@ async def add_document(request: DocumentRequest) -> DocumentResponse:
         ) from e
 
 
+@app.post("/documents/batch", response_model=BatchDocumentResponse)
+async def add_documents(request: BatchDocumentRequest) -> BatchDocumentResponse:
+    """
+    Add multiple documents to vector database.
+
+    Documents already stored with unchanged text and metadata are skipped.
+    The rest are processed in slices: each slice is embedded with one
+    batched call while the previous slice is being stored.
+
+    Args:
+        request: Batch request with documents (ID, text, and metadata each).
+
+    Returns:
+        Added and unchanged document IDs, status and timing.
+
+    Raises:
+        HTTPException: If document addition fails.
+
+    Example:
+        ```json
+        {
+            "documents": [
+                {"document_id": "doc_1", "text": "First document..."},
+                {"document_id": "doc_2", "text": "Second document..."}
+            ]
+        }
+        ```
+    """
+    try:
+        start_time = time.perf_counter()
+
+        document_ids, unchanged_ids = await _add_changed_documents(request.documents)
+
+        processing_time = time.perf_counter() - start_time
+
+        logger.info(
+            "Added %d documents in %.2fs (%d unchanged)",
+            len(document_ids),
+            processing_time,
+            len(unchanged_ids),
+        )
+
+        return BatchDocumentResponse(
+            document_ids=document_ids,
+            unchanged_ids=unchanged_ids,
+            status="success" if document_ids else "unchanged",
+            count=len(document_ids),
+            processing_time=processing_time,
+        )
+
+    except Exception as e:
+        logger.error("Batch document addition error: %s", str(e), exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Failed to add documents: {str(e)}"
+        ) from e
+
+
+@app.post("/documents/jobs", response_model=IngestionJobResponse, status_code=202)
+async def submit_ingestion_job(
+    request: BatchDocumentRequest, background_tasks: BackgroundTasks
+) -> IngestionJobResponse:
+    """
+    Queue documents for ingestion and return immediately.
+
+    Same work as ``/documents/batch``, but embedding and storage run after the
+    response is sent. Poll ``GET /documents/jobs/{job_id}`` for the outcome.
+
+    Args:
+        request: Batch request with documents (ID, text, and metadata each).
+        background_tasks: Tasks run once the response has been sent.
+
+    Returns:
+        The pending job.
+
+    Example:
+        ```json
+        {
+            "documents": [
+                {"document_id": "doc_1", "text": "First document..."}
+            ]
+        }
+        ```
+    """
+    job_id = uuid.uuid4().hex
+    ingestion_jobs[job_id] = {"job_id": job_id, "status": "pending"}
+
+    # Forget the oldest jobs so the registry stays bounded
+    while len(ingestion_jobs) > MAX_TRACKED_JOBS:
+        ingestion_jobs.popitem(last=False)
+
+    background_tasks.add_task(_run_ingestion_job, job_id, request.documents)
+    logger.info("Queued ingestion job %s (%d documents)", job_id, len(request.documents))
+
+    return IngestionJobResponse(**ingestion_jobs[job_id])
+
+
+@app.get("/documents/jobs/{job_id}", response_model=IngestionJobResponse)
+async def get_ingestion_job(job_id: str) -> IngestionJobResponse:
+    """
+    Get the status of a background ingestion job.
+
+    Args:
+        job_id: Identifier returned by ``POST /documents/jobs``.
+
+    Returns:
+        Current job status and, once finished, its results.
+
+    Raises:
+        HTTPException: If the job is unknown.
+    """
+    job = ingestion_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    return IngestionJobResponse(**job)
+
+
 @app.delete("/documents/{document_id}")
 async def delete_document(document_id: str) -> Dict[str, str]:
     """
@@ -556,7 +1159,7 @@ async def delete_document(document_id: str) -> Dict[str, str]:
         ```
     """
     try:
-        success = chroma_service.delete_document(document_id)
+        success = await _run_blocking(chroma_service.delete_document, document_id)
 
         if success:
             logger.info("Deleted document '%s'", document_id)
@@ -578,13 +1181,58 @@ async def delete_document(document_id: str) -> Dict[str, str]:
         ) from e
 
 
+@app.delete("/files/{file_id}")
+async def delete_file_documents(file_id: int) -> Dict[str, Any]:
+    """
+    Delete all documents stored for a file.
+
+    Matches on the ``file_id`` metadata key, so every document ingested for
+    the file is removed in one call.
+
+    Args:
+        file_id: File identifier stored in document metadata.
+
+    Returns:
+        Deletion status and number of documents deleted.
+
+    Raises:
+        HTTPException: If no documents belong to the file or deletion fails.
+
+    Example:
+        ```bash
+        curl -X DELETE http://localhost:8000/files/42
+        ```
+    """
+    try:
+        deleted = await _run_blocking(
+            chroma_service.delete_by_filter, {"file_id": file_id}
+        )
+
+        if not deleted:
+            raise HTTPException(
+                status_code=404, detail=f"No documents found for file {file_id}"
+            )
+
+        logger.info("Deleted %d documents for file %d", deleted, file_id)
+        return {"status": "success", "deleted": deleted}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("File document deletion error: %s", str(e), exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"Failed to delete documents: {str(e)}"
+        ) from e
+
+
 @app.get("/stats")
 async def get_stats() -> Dict[str, Any]:
     """
     Get service statistics and health information.
 
     Returns:
-        Service metrics including Ollama availability and ChromaDB stats.
+        Service metrics including Ollama availability, ChromaDB stats and the
+        number of distinct source files.
 
     Example:
         ```bash
@@ -592,9 +1240,10 @@ async def get_stats() -> Dict[str, Any]:
         ```
     """
     return {
-        "ollama_available": ollama_service.is_available(),
+        "ollama_available": await _cached_ollama_available(),
         "ollama_model": settings.ollama_model,
-        "chroma_stats": chroma_service.get_collection_stats(),
+        "chroma_stats": await _cached_chroma_stats(),
+        "unique_files": await _cached_unique_file_count(),
     }
 
 
@@ -603,45 +1252,262 @@ async def get_stats() -> Dict[str, Any]:
 # ============================================================================
 
 
-def _enhance_search_query(original_query: str) -> str:
+T = TypeVar("T")
+
+
+async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
     """
-    Enhance search query using LLM for better semantic matching.
+    Run a blocking call on the bounded I/O thread pool.
 
     Args:
-        original_query: Original user search query.
+        func: Blocking callable.
+        *args: Positional arguments for the callable.
+        **kwargs: Keyword arguments for the callable.
 
     Returns:
-        Enhanced query with synonyms and related terms.
+        The callable's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        blocking_executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+@async_ttl_cache(ttl=settings.health_cache_ttl)
+async def _cached_ollama_available() -> bool:
+    """
+    Check Ollama availability, reusing the result for a short TTL.
+
+    Returns:
+        True if Ollama responded to the last availability check.
     """
+    return await ollama_service.ais_available()
+
+
+@async_ttl_cache(ttl=settings.health_cache_ttl)
+async def _cached_chroma_stats() -> Dict[str, Any]:
+    """
+    Get ChromaDB collection statistics, reusing the result for a short TTL.
+
+    Returns:
+        Collection statistics dictionary.
+    """
+    return await _run_blocking(chroma_service.get_collection_stats)
+
+
+@async_ttl_cache(ttl=settings.health_cache_ttl)
+async def _cached_unique_file_count() -> int:
+    """
+    Count distinct source files in ChromaDB, reusing the result for a short TTL.
+
+    Returns:
+        Number of distinct 'file_id' metadata values.
+    """
+    return await _run_blocking(chroma_service.count_unique_files)
+
+
+def _invalidate_on_transport_error(error: BaseException) -> None:
+    """
+    Drop the cached Ollama availability when a request hit a transport error.
+
+    Keeps health checks from reporting a stale "available" after Ollama
+    has gone away.
+
+    Args:
+        error: Exception raised while calling Ollama.
+    """
+    cause = error.__cause__ or error
+    if isinstance(cause, httpx.TransportError):
+        _cached_ollama_available.invalidate()
+
+
+async def _warm_up() -> None:
+    """
+    Exercise the generation, embedding and search paths once.
+
+    Makes Ollama load both models and ChromaDB load its index, so the first
+    real request does not pay for it. Failures are logged and ignored.
+    """
+    start_time = time.perf_counter()
+
     try:
-        enhance_prompt = f"""Original search query: "{original_query}"
+        await ollama_service.agenerate("warmup", max_tokens=1)
+        embedding = await ollama_service.aembed_text("warmup")
+        await _run_blocking(chroma_service.search_similar, embedding)
+    except Exception as e:
+        logger.warning("Warmup failed: %s", str(e))
+        return
 
-Expand this query by:
-1. Adding relevant synonyms and related terms
-2. Including technical terminology if applicable
-3. Clarifying ambiguous terms
-4. Keeping the core intent
+    logger.info("Warmup completed in %.2fs", time.perf_counter() - start_time)
 
-Provide ONLY the enhanced query, no explanations."""
 
-        system_prompt = (
-            "You are a search query optimizer. Expand queries to improve "
-            "semantic search results while preserving the original intent. "
-            "Output only the enhanced query text."
+async def _add_changed_documents(
+    documents: List[DocumentRequest],
+) -> Tuple[List[str], List[str]]:
+    """
+    Add documents, skipping those already stored unchanged.
+
+    Args:
+        documents: Documents to add.
+
+    Returns:
+        Identifiers of the added documents and of the unchanged documents,
+        each in request order.
+    """
+    unchanged = await _run_blocking(
+        chroma_service.find_unchanged,
+        [
+            (document.document_id, document.text, document.metadata or {})
+            for document in documents
+        ],
+    )
+
+    document_ids = await _ingest_documents(
+        [document for document in documents if document.document_id not in unchanged]
+    )
+    unchanged_ids = [
+        document.document_id for document in documents
+        if document.document_id in unchanged
+    ]
+
+    return document_ids, unchanged_ids
+
+
+async def _run_ingestion_job(job_id: str, documents: List[DocumentRequest]) -> None:
+    """
+    Run a background ingestion job and record its outcome.
+
+    Args:
+        job_id: Job identifier.
+        documents: Documents to add.
+    """
+    job = ingestion_jobs.get(job_id)
+    if job is None:
+        return
+
+    job["status"] = "running"
+    start_time = time.perf_counter()
+
+    try:
+        document_ids, unchanged_ids = await _add_changed_documents(documents)
+    except Exception as e:
+        logger.error("Ingestion job %s failed: %s", job_id, str(e), exc_info=True)
+        job["status"] = "failed"
+        job["error"] = str(e)
+    else:
+        job["status"] = "success" if document_ids else "unchanged"
+        job["document_ids"] = document_ids
+        job["unchanged_ids"] = unchanged_ids
+        job["count"] = len(document_ids)
+        logger.info(
+            "Ingestion job %s added %d documents (%d unchanged)",
+            job_id,
+            len(document_ids),
+            len(unchanged_ids),
+        )
+    finally:
+        job["processing_time"] = time.perf_counter() - start_time
+
+
+async def _ingest_documents(documents: List[DocumentRequest]) -> List[str]:
+    """
+    Embed and store documents slice by slice.
+
+    The next slice is embedded by Ollama while the current one is written
+    to ChromaDB, so the two stages overlap instead of running back to back.
+
+    Args:
+        documents: Documents to add.
+
+    Returns:
+        Identifiers of the added documents, in request order.
+    """
+    slices = [
+        documents[i:i + INGEST_BATCH_SIZE]
+        for i in range(0, len(documents), INGEST_BATCH_SIZE)
+    ]
+
+    def store_slice(
+        batch: List[DocumentRequest], embeddings: List[List[float]]
+    ) -> List[str]:
+        return chroma_service.add_documents(
+            document_ids=[document.document_id for document in batch],
+            texts=[document.text for document in batch],
+            embeddings=embeddings,
+            metadatas=[document.metadata or {} for document in batch],
         )
 
-        enhanced_query = ollama_service.generate(
-            prompt=enhance_prompt,
-            system_prompt=system_prompt,
+    def embed_slice(batch: List[DocumentRequest]) -> "asyncio.Task[List[List[float]]]":
+        return asyncio.create_task(
+            ollama_service.aembed_texts([document.text for document in batch])
+        )
+
+    if not slices:
+        return []
+
+    document_ids: List[str] = []
+    pending = embed_slice(slices[0])
+
+    try:
+        for index, batch in enumerate(slices):
+            embeddings = await pending
+            if index + 1 < len(slices):
+                pending = embed_slice(slices[index + 1])
+
+            document_ids.extend(await _run_blocking(store_slice, batch, embeddings))
+    finally:
+        pending.cancel()
+
+    return document_ids
+
+
+async def _enhance_search_query(
+    original_query: str, query_embedding: Optional[List[float]] = None
+) -> str:
+    """
+    Enhance search query using LLM for better semantic matching.
+
+    Enhancements of identical earlier queries, or of semantically similar
+    ones when a query embedding is provided, are reused instead of calling
+    the LLM.
+
+    Args:
+        original_query: Original user search query.
+        query_embedding: Optional embedding of the original query.
+
+    Returns:
+        Enhanced query with synonyms and related terms.
+    """
+    if enhancement_cache is not None:
+        cached_query = enhancement_cache.get(
+            query_embedding, key=_query_cache_key(original_query)
+        )
+        if cached_query is not None:
+            logger.info(
+                "Enhanced query (cached): '%s' -> '%s'", original_query, cached_query
+            )
+            return cached_query
+
+    try:
+        enhanced_query = await ollama_service.agenerate(
+            prompt=ENHANCE_PROMPT_TEMPLATE.format(query=original_query),
+            system_prompt=ENHANCE_SYSTEM_PROMPT,
             temperature=0.3,  # Low temperature for consistency
             max_tokens=100,
-        ).strip()
+        )
+        enhanced_query = enhanced_query.strip()
 
         # Validate enhanced query
         if 0 < len(enhanced_query) < 500:
             logger.info(
                 "Enhanced query: '%s' -> '%s'", original_query, enhanced_query
             )
+            if enhancement_cache is not None and query_embedding is not None:
+                enhancement_cache.put(
+                    query_embedding,
+                    enhanced_query,
+                    key=_query_cache_key(original_query),
+                )
             return enhanced_query
         else:
             logger.warning(
@@ -653,41 +1519,310 @@ Provide ONLY the enhanced query, no explanations."""
         logger.warning(
             "Query enhancement failed: %s, using original query", str(e)
         )
+        _invalidate_on_transport_error(e)
+        return original_query
+
+
+def _should_enhance_query(query: str) -> bool:
+    """
+    Decide whether a search query is worth an LLM enhancement.
+
+    Very short queries gain little from the extra round trip and very long
+    ones are already specific.
+
+    Args:
+        query: Normalized search query.
+
+    Returns:
+        True if enhancement is enabled and the query passes the size gates.
+    """
+    return (
+        settings.enable_query_enhancement
+        and len(query) <= settings.query_enhancement_max_chars
+        and _word_count(query) >= settings.query_enhancement_min_words
+    )
+
+
+async def _await_enhancement(task: "asyncio.Task[str]", original_query: str) -> str:
+    """
+    Wait for a query enhancement within the configured time budget.
+
+    An enhancement that misses the budget is cancelled, so it does not keep
+    holding a generation slot that /generate and /summarize need.
+
+    Args:
+        task: Running enhancement task.
+        original_query: Query to fall back to.
+
+    Returns:
+        Enhanced query, or the original query if the budget ran out.
+    """
+    timeout = settings.query_enhancement_timeout_ms / 1000 or None
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+
+    if not done:
+        task.cancel()
+        logger.info(
+            "Query enhancement exceeded %.0fms, using original query",
+            settings.query_enhancement_timeout_ms,
+        )
         return original_query
 
+    return task.result()
+
+
+def _normalize_query(query: str) -> str:
+    """
+    Normalize the whitespace of a search query before embedding it.
+
+    Case is preserved, since acronyms, proper nouns and code identifiers
+    can embed differently from their lowercased forms.
+
+    Args:
+        query: Raw search query.
+
+    Returns:
+        Query with surrounding and repeated whitespace removed.
+    """
+    return " ".join(query.split())
+
+
+def _query_cache_key(query: str) -> str:
+    """
+    Build the enhancement cache key of a normalized search query.
+
+    Args:
+        query: Normalized search query.
+
+    Returns:
+        Lowercased query, so case variants share a cached enhancement.
+    """
+    return query.lower()
+
+
+def _is_confident_match(results: Dict[str, List[Any]]) -> bool:
+    """
+    Check whether the best search result is close enough to skip enhancement.
+
+    Args:
+        results: Raw search results from ChromaDB.
+
+    Returns:
+        True if the top result distance is within the early-exit threshold.
+    """
+    distances = results.get("distances") or []
+
+    if distances and distances[0] <= settings.search_early_exit_distance:
+        logger.info(
+            "Early exit: top result distance %.3f within threshold %.3f",
+            distances[0],
+            settings.search_early_exit_distance,
+        )
+        return True
+
+    return False
+
+
+async def _stream_completion(
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    operation: str,
+    build_summary: Callable[[str], Dict[str, Any]],
+) -> AsyncIterator[str]:
+    """
+    Relay streamed Ollama tokens as server-sent events.
+
+    Args:
+        prompt: Prompt to generate from.
+        system_prompt: Optional system prompt.
+        temperature: Sampling temperature.
+        max_tokens: Maximum number of tokens to generate.
+        operation: Operation name used in logs and error events.
+        build_summary: Builds extra fields of the final event from the full text.
+
+    Yields:
+        Encoded ``data:`` events, ending with a ``done`` or ``error`` event.
+    """
+    start_time = time.perf_counter()
+    tokens: List[str] = []
+
+    try:
+        async for token in ollama_service.astream_generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        ):
+            tokens.append(token)
+            yield _sse_event({"token": token})
+
+    except Exception as e:
+        logger.error("%s stream error: %s", operation, str(e), exc_info=True)
+        _invalidate_on_transport_error(e)
+        yield _sse_event({"detail": f"{operation} failed: {str(e)}"}, event="error")
+        return
+
+    processing_time = time.perf_counter() - start_time
+    text = "".join(tokens).strip()
+
+    logger.info(
+        "Streamed %s in %.2fs (length: %d chars)",
+        operation.lower(),
+        processing_time,
+        len(text),
+    )
+
+    yield _sse_event(
+        {"done": True, **build_summary(text), "processing_time": processing_time}
+    )
+
+
+async def _stream_unchanged_text(
+    text: str, build_summary: Callable[[str], Dict[str, Any]]
+) -> AsyncIterator[str]:
+    """
+    Stream text that needs no generation as a single token event.
+
+    Args:
+        text: Text to send.
+        build_summary: Builds extra fields of the final event from the text.
+
+    Yields:
+        A token event followed by a ``done`` event.
+    """
+    yield _sse_event({"token": text})
+    yield _sse_event({"done": True, **build_summary(text), "processing_time": 0.0})
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Estimate the LLM token count of a text without a tokenizer.
+
+    Args:
+        text: Text to estimate.
+
+    Returns:
+        Approximate number of tokens.
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _check_token_budget(max_tokens: int, *texts: str) -> None:
+    """
+    Reject requests that cannot fit the model context before calling the LLM.
+
+    Args:
+        max_tokens: Requested completion length in tokens.
+        *texts: Prompt parts sent to the model.
+
+    Raises:
+        HTTPException: 413 if the estimated prompt tokens plus max_tokens
+            exceed the configured context budget.
+    """
+    prompt_tokens = sum(_estimate_tokens(text) for text in texts)
+
+    if prompt_tokens + max_tokens > settings.max_context_tokens:
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                f"Input too long: ~{prompt_tokens} prompt tokens plus "
+                f"{max_tokens} max tokens exceeds the limit of "
+                f"{settings.max_context_tokens}"
+            ),
+        )
+
+
+def _is_short_enough_to_skip_summary(word_count: int) -> bool:
+    """
+    Check whether a text is already short enough to be its own summary.
+
+    Args:
+        word_count: Word count of the text.
+
+    Returns:
+        True if summarization should be skipped.
+    """
+    if word_count <= settings.summary_min_words:
+        logger.debug(
+            "Skipping summarization of %d-word text (threshold: %d)",
+            word_count,
+            settings.summary_min_words,
+        )
+        return True
+
+    return False
+
+
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """
+    Encode a server-sent event.
+
+    Args:
+        data: JSON-serializable event payload.
+        event: Optional event type.
+
+    Returns:
+        Event text terminated by a blank line.
+    """
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {orjson.dumps(data).decode()}\n\n"
+
+
+def _word_count(text: str) -> int:
+    """
+    Count whitespace-delimited words.
+
+    str.split() runs in C and is several times faster than iterating
+    regex matches, even though it builds a list of the words.
+
+    Args:
+        text: Text to count words in.
+
+    Returns:
+        Number of words.
+    """
+    return len(text.split())
+
+
+def _encode_float16(embedding: List[float]) -> str:
+    """
+    Encode an embedding as base64 little-endian FP16 bytes.
+
+    Args:
+        embedding: Embedding vector.
+
+    Returns:
+        Base64 string of the half-precision vector.
+    """
+    return base64.b64encode(np.asarray(embedding, dtype="<f2").tobytes()).decode("ascii")
+
 
 def _format_search_results(
     results: Dict[str, List[Any]]
-) -> List[Dict[str, Any]]:
+) -> List[SearchHit]:
     """
     Format ChromaDB search results for API response.
 
+    Hits are built without validation since ChromaDB results are trusted.
+
     Args:
         results: Raw search results from ChromaDB.
 
     Returns:
         Formatted list of search results with documents, metadata, and scores.
     """
-    formatted_results = []
-
-    for i in range(len(results.get("documents", []))):
-        formatted_results.append(
-            {
-                "document": results["documents"][i],
-                "metadata": (
-                    results["metadatas"][i]
-                    if i < len(results.get("metadatas", []))
-                    else {}
-                ),
-                "distance": (
-                    results["distances"][i]
-                    if i < len(results.get("distances", []))
-                    else 0.0
-                ),
-            }
-        )
+    documents = results.get("documents") or []
+    metadatas = itertools.chain(results.get("metadatas") or [], itertools.repeat(None))
+    distances = itertools.chain(results.get("distances") or [], itertools.repeat(0.0))
 
-    return formatted_results
+    return [
+        SearchHit.model_construct(
+            document=document, metadata=metadata or {}, distance=distance
+        )
+        for document, metadata, distance in zip(documents, metadatas, distances)
+    ]
 
 
 # ============================================================================
@@ -700,6 +1835,12 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.host,
         port=settings.port,
+        workers=settings.workers,
+        loop="auto",  # uvloop when installed
+        http="auto",  # httptools when installed
         reload=False,
         log_level="info",
+        access_log=settings.access_log,
+        limit_concurrency=settings.limit_concurrency or None,
+        timeout_keep_alive=settings.timeout_keep_alive,
     )
\ No newline at end of file
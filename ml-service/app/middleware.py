@@ -0,0 +1,196 @@
+"""
+HTTP Middleware Module.
+
+This module provides ASGI middleware for compressed request and response
+bodies, so large ingestion batches and search result sets cost fewer bytes
+on the wire.
+
+Key Features:
+- Transparent decompression of gzip-encoded request bodies
+- Limit on decompressed request size against decompression bombs
+- Gzip response compression that leaves Server-Sent Event streams untouched
+"""
+
+
+import logging
+import zlib
+from typing import List, Tuple
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTooLargeError(Exception):
+    """Exception raised when a request body exceeds the size limit."""
+    pass
+
+
+class GZipRequestMiddleware:
+    """
+    Decompress request bodies sent with ``Content-Encoding: gzip``.
+
+    Downstream handlers see a plain body with matching ``Content-Length``.
+    Malformed bodies are rejected with 400, oversized ones with 413.
+
+    Attributes:
+        max_body_size: Maximum size of a request body in bytes, before and
+            after decompression
+    """
+
+    # Constants
+    DEFAULT_MAX_BODY_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, app: ASGIApp, max_body_size: int = DEFAULT_MAX_BODY_SIZE) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_body_size: Maximum size of a request body in bytes
+
+        Raises:
+            ValueError: If max_body_size is not positive
+        """
+        if max_body_size < 1:
+            raise ValueError("max_body_size must be positive")
+
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Decompress the request body if it is gzip-encoded, then dispatch."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if headers.get("content-encoding", "").strip().lower() != "gzip":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            body = self._decompress(await self._read_body(receive))
+        except RequestTooLargeError as e:
+            await JSONResponse({"detail": str(e)}, status_code=413)(scope, receive, send)
+            return
+        except zlib.error as e:
+            logger.warning("Rejected malformed gzip request body: %s", str(e))
+            await JSONResponse(
+                {"detail": "Malformed gzip request body"}, status_code=400
+            )(scope, receive, send)
+            return
+
+        scope = dict(scope, headers=self._rewrite_headers(scope["headers"], len(body)))
+        body_sent = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, receive_decompressed, send)
+
+    async def _read_body(self, receive: Receive) -> bytes:
+        """
+        Read the complete raw request body.
+
+        Args:
+            receive: ASGI receive callable
+
+        Returns:
+            Compressed request body
+
+        Raises:
+            RequestTooLargeError: If the body exceeds max_body_size
+        """
+        chunks: List[bytes] = []
+        size = 0
+        more_body = True
+
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                raise RequestTooLargeError("Request body too large")
+
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        return b"".join(chunks)
+
+    def _decompress(self, body: bytes) -> bytes:
+        """
+        Decompress a gzip body without inflating past the size limit.
+
+        Args:
+            body: Compressed request body
+
+        Returns:
+            Decompressed request body
+
+        Raises:
+            RequestTooLargeError: If the decompressed body exceeds max_body_size
+            zlib.error: If the body is not valid gzip data
+        """
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        data = decompressor.decompress(body, self.max_body_size + 1)
+
+        if len(data) > self.max_body_size or decompressor.unconsumed_tail:
+            raise RequestTooLargeError("Decompressed request body too large")
+
+        if not decompressor.eof:
+            raise zlib.error("Truncated gzip stream")
+
+        return data
+
+    @staticmethod
+    def _rewrite_headers(
+        raw_headers: List[Tuple[bytes, bytes]], content_length: int
+    ) -> List[Tuple[bytes, bytes]]:
+        """
+        Drop the content encoding and set the decompressed content length.
+
+        Args:
+            raw_headers: Original ASGI request headers
+            content_length: Size of the decompressed body
+
+        Returns:
+            Headers describing the decompressed body
+        """
+        headers = [
+            (name, value)
+            for name, value in raw_headers
+            if name.lower() not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(content_length).encode("latin-1")))
+        return headers
+
+
+class GZipResponseMiddleware(GZipMiddleware):
+    """
+    Gzip-compress responses, except Server-Sent Event streams.
+
+    Starlette's GZipMiddleware buffers streamed bodies until enough data has
+    been compressed, which would hold back individual SSE events, so the
+    ``/stream`` endpoints are passed through uncompressed.
+    """
+
+    STREAMING_PATH_SUFFIX = "/stream"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress the response unless the route streams events."""
+        if scope["type"] == "http" and scope["path"].endswith(self.STREAMING_PATH_SUFFIX):
+            await self.app(scope, receive, send)
+            return
+
+        await super().__call__(scope, receive, send)
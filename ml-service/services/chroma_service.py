@@ -7,18 +7,30 @@ search, and collection management.
 
 Key Features:
 - Document embedding storage with metadata
-- Similarity search using cosine distance
+- Similarity search using cosine (or inner-product) distance
+- Embeddings L2-normalized on write and query
+- Optional exact re-ranking of approximate HNSW candidates
+- Optional similarity cache of search results, cleared on every write
+- Configurable HNSW index parameters for new collections
 - Document lifecycle management (add, delete, query)
+- Idempotent ingestion via upserts and content hashes
+- Batched ingestion with one upsert per batch
 - Collection statistics and monitoring
 """
 
 
+import hashlib
+import json
 import logging
-from typing import Any, List, Dict, Optional
+import threading
+from typing import Any, List, Dict, Optional, Set, Tuple
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 
+from services.semantic_cache import SemanticCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,18 +55,51 @@ class ChromaService:
         persist_directory: Directory path for ChromaDB persistence
         collection_name: Name of the ChromaDB collection
         num_results: Number of results to return for similarity searches
+        similarity_metric: HNSW distance space of the collection
+        hnsw_config: Effective HNSW index parameters of the collection
+        exact_rerank: Whether search candidates are re-scored exactly
+        overfetch_factor: Candidates fetched per requested result before deduplication
+        result_cache_size: Maximum number of cached unfiltered search results
         client: ChromaDB client instance
         collection: ChromaDB collection instance
     """
     
     # Constants
     DEFAULT_SIMILARITY_METRIC = "cosine"
+    SUPPORTED_SIMILARITY_METRICS = ("cosine", "ip")
+    CONTENT_HASH_KEY = "content_hash"
+    DEFAULT_HNSW_M = 16
+    DEFAULT_HNSW_CONSTRUCTION_EF = 200
+    DEFAULT_HNSW_SEARCH_EF = 100
+    DEFAULT_OVERFETCH_FACTOR = 10
+    # (max vector count, M, construction_ef, search_ef), smallest tier first
+    HNSW_TIERS = (
+        (10_000, 16, 100, 50),
+        (1_000_000, 24, 200, 100),
+        (None, 32, 400, 200),
+    )
+    DEFAULT_RESULT_CACHE_THRESHOLD = 0.98
+    # ChromaDB's own values for index parameters missing from collection metadata
+    CHROMA_HNSW_DEFAULTS = {
+        "hnsw:space": "l2",
+        "hnsw:M": 16,
+        "hnsw:construction_ef": 100,
+        "hnsw:search_ef": 10
+    }
     
     def __init__(
         self, 
         persist_directory: str = "./chroma_db", 
         collection_name: str = "documents",
-        num_results: int = 5
+        num_results: int = 5,
+        similarity_metric: str = DEFAULT_SIMILARITY_METRIC,
+        hnsw_m: int = DEFAULT_HNSW_M,
+        hnsw_construction_ef: int = DEFAULT_HNSW_CONSTRUCTION_EF,
+        hnsw_search_ef: int = DEFAULT_HNSW_SEARCH_EF,
+        exact_rerank: bool = False,
+        overfetch_factor: int = DEFAULT_OVERFETCH_FACTOR,
+        result_cache_size: int = 0,
+        result_cache_threshold: float = DEFAULT_RESULT_CACHE_THRESHOLD
     ) -> None:
         """
         Initialize ChromaDB service with persistent storage.
@@ -63,13 +108,60 @@ class ChromaService:
             persist_directory: Directory path for ChromaDB data persistence
             collection_name: Name of the collection to create/use
             num_results: Number of results to return for similarity searches
+            similarity_metric: Distance space for new collections ('cosine' or 'ip').
+                Embeddings are normalized, so both yield identical rankings;
+                'ip' skips the per-vector norm computation during search.
+                An existing collection keeps its space, so stored distances
+                stay on the scale they were created with.
+            hnsw_m: Graph links per node for new collections (higher = better
+                recall, more memory)
+            hnsw_construction_ef: Candidate list size while building the index
+            hnsw_search_ef: Candidate list size while querying
+            exact_rerank: Re-score the over-fetched HNSW candidates with exact
+                inner products before deduplication, correcting approximate
+                distances at the cost of transferring candidate embeddings
+            overfetch_factor: Candidates fetched per requested result, so
+                deduplication by file still leaves num_results files; 1 suits
+                collections that store a single document per file
+            result_cache_size: Maximum number of unfiltered search results
+                reused for near-identical query embeddings (0 disables)
+            result_cache_threshold: Minimum cosine similarity between query
+                embeddings for a cached result to be reused
             
         Raises:
             ChromaServiceError: If initialization fails
+            ValueError: If similarity_metric or an HNSW parameter is invalid
         """
+        if similarity_metric not in self.SUPPORTED_SIMILARITY_METRICS:
+            raise ValueError(
+                f"similarity_metric must be one of {self.SUPPORTED_SIMILARITY_METRICS}"
+            )
+        
+        if min(hnsw_m, hnsw_construction_ef, hnsw_search_ef) < 1:
+            raise ValueError("HNSW parameters must be positive integers")
+        
+        if overfetch_factor < 1:
+            raise ValueError("overfetch_factor must be at least 1")
+        
+        if result_cache_size < 0:
+            raise ValueError("result_cache_size must be non-negative")
+        
         self.persist_directory = persist_directory
         self.collection_name = collection_name
         self.num_results = num_results
+        self.exact_rerank = exact_rerank
+        self.overfetch_factor = overfetch_factor
+        self.result_cache_size = result_cache_size
+
+        # Search results by query embedding; any write clears it, and the
+        # generation counter keeps searches that raced a write from caching
+        self._result_cache = (
+            SemanticCache(max_size=result_cache_size, threshold=result_cache_threshold)
+            if result_cache_size
+            else None
+        )
+        self._write_generation = 0
+        self._result_cache_lock = threading.Lock()
 
         try:
             # Initialize ChromaDB client with persistent storage
@@ -78,16 +170,39 @@ class ChromaService:
                 settings=ChromaSettings(anonymized_telemetry=False)
             )
             
-            # Get or create collection with cosine similarity
-            self.collection = self.client.get_or_create_collection(
-                name=collection_name,
-                metadata={"hnsw:space": self.DEFAULT_SIMILARITY_METRIC}
+            self.collection = self._open_collection(
+                collection_name,
+                {
+                    "hnsw:space": similarity_metric,
+                    "hnsw:M": hnsw_m,
+                    "hnsw:construction_ef": hnsw_construction_ef,
+                    "hnsw:search_ef": hnsw_search_ef
+                }
             )
             
+            # Report the parameters the index was built with, which may
+            # differ from the requested ones for an existing collection
+            index_params = {
+                **self.CHROMA_HNSW_DEFAULTS,
+                **{
+                    key: value
+                    for key, value in (self.collection.metadata or {}).items()
+                    if key in self.CHROMA_HNSW_DEFAULTS
+                }
+            }
+            self.similarity_metric = index_params["hnsw:space"]
+            self.hnsw_config = {
+                "M": index_params["hnsw:M"],
+                "construction_ef": index_params["hnsw:construction_ef"],
+                "search_ef": index_params["hnsw:search_ef"]
+            }
+            
             logger.info(
-                "ChromaDB service initialized (collection: %s, path: %s)",
+                "ChromaDB service initialized (collection: %s, path: %s, space: %s, hnsw: %s)",
                 collection_name,
-                persist_directory
+                persist_directory,
+                self.similarity_metric,
+                self.hnsw_config
             )
             
         except Exception as e:
@@ -105,6 +220,12 @@ class ChromaService:
         """
         Add a document with its embedding to the vector database.
         
+        Uses an upsert, so re-adding an existing document ID replaces it
+        instead of creating a duplicate. A hash of the text and metadata is
+        stored under the reserved 'content_hash' metadata key (see
+        has_same_content); it is removed from metadata returned to callers.
+        Single-document form of add_documents().
+        
         Args:
             document_id: Unique identifier for the document
             text: Document text content
@@ -137,25 +258,155 @@ class ChromaService:
         if not embedding or not isinstance(embedding, list):
             raise ValueError("embedding must be a non-empty list of floats")
         
+        return self.add_documents(
+            document_ids=[document_id],
+            texts=[text],
+            embeddings=[embedding],
+            metadatas=[metadata]
+        )[0]
+    
+    def add_documents(
+        self,
+        document_ids: List[str],
+        texts: List[str],
+        embeddings: List[List[float]],
+        metadatas: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[str]:
+        """
+        Add multiple documents with their embeddings in one upsert.
+        
+        Behaves like add_document() for each document, but writes the whole
+        batch to the index at once.
+        
+        Args:
+            document_ids: Unique identifiers, one per document
+            texts: Document text contents
+            embeddings: Pre-computed embedding vectors
+            metadatas: Optional metadata per document
+            
+        Returns:
+            The document IDs that were added, in input order
+            
+        Raises:
+            ChromaServiceError: If document addition fails
+            ValueError: If inputs are invalid
+            
+        Example:
+            >>> service = ChromaService()
+            >>> service.add_documents(
+            ...     document_ids=["doc_1", "doc_2"],
+            ...     texts=["First document", "Second document"],
+            ...     embeddings=[[0.1, 0.2], [0.3, 0.4]]
+            ... )
+            ['doc_1', 'doc_2']
+        """
+        if metadatas is None:
+            metadatas = [None] * len(document_ids)
+        
+        # Validate inputs
+        if not document_ids:
+            raise ValueError("document_ids must be a non-empty list")
+        
+        if not len(document_ids) == len(texts) == len(embeddings) == len(metadatas):
+            raise ValueError("document_ids, texts, embeddings and metadatas must have equal lengths")
+        
+        if not all(document_id and isinstance(document_id, str) for document_id in document_ids):
+            raise ValueError("document_ids must be non-empty strings")
+        
+        if not all(text and isinstance(text, str) for text in texts):
+            raise ValueError("texts must be non-empty strings")
+        
+        if not all(embedding and isinstance(embedding, list) for embedding in embeddings):
+            raise ValueError("embeddings must be non-empty lists of floats")
+        
+        stored_metadatas = [
+            {**(metadata or {}), self.CONTENT_HASH_KEY: self.compute_content_hash(text, metadata)}
+            for text, metadata in zip(texts, metadatas)
+        ]
+        
         try:
-            self.collection.add(
-                documents=[text],
-                embeddings=[embedding],
-                metadatas=[metadata or {}],
-                ids=[document_id]
+            self.collection.upsert(
+                documents=texts,
+                embeddings=self._normalize_batch(embeddings),
+                metadatas=stored_metadatas,
+                ids=document_ids
             )
+            self._invalidate_result_cache()
             
-            logger.info("Added document '%s' to ChromaDB (text_length: %d)", document_id, len(text))
-            return document_id
+            logger.info("Added %d documents to ChromaDB", len(document_ids))
+            return list(document_ids)
             
         except Exception as e:
             logger.error(
-                "Failed to add document '%s': %s", 
-                document_id, 
-                str(e), 
+                "Failed to add %d documents: %s",
+                len(document_ids),
+                str(e),
                 exc_info=True
             )
-            raise ChromaServiceError(f"Failed to add document: {str(e)}") from e
+            raise ChromaServiceError(f"Failed to add documents: {str(e)}") from e
+    
+    def has_same_content(
+        self,
+        document_id: str,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Check whether a document is already stored with identical content.
+        
+        Lets callers skip re-embedding when the same document is ingested again.
+        
+        Args:
+            document_id: Unique identifier of the document
+            text: Document text content
+            metadata: Optional document metadata
+            
+        Returns:
+            True if the stored document has the same text and metadata
+        """
+        if not document_id or not isinstance(document_id, str):
+            raise ValueError("document_id must be a non-empty string")
+        
+        return document_id in self.find_unchanged([(document_id, text, metadata)])
+    
+    def find_unchanged(
+        self,
+        documents: List[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> Set[str]:
+        """
+        Find which documents are already stored with identical content.
+        
+        Looks up all stored content hashes with a single metadata-only query.
+        
+        Args:
+            documents: (document_id, text, metadata) tuples to check
+            
+        Returns:
+            IDs of documents whose stored text and metadata are unchanged
+        """
+        if not documents:
+            return set()
+        
+        try:
+            results = self.collection.get(
+                ids=list({document_id for document_id, _, _ in documents}),
+                include=["metadatas"]
+            )
+        except Exception as e:
+            logger.warning("Failed to check stored content: %s", str(e))
+            return set()
+        
+        stored_hashes = {
+            document_id: (metadata or {}).get(self.CONTENT_HASH_KEY)
+            for document_id, metadata in zip(results["ids"], results["metadatas"])
+        }
+        
+        return {
+            document_id
+            for document_id, text, metadata in documents
+            if document_id in stored_hashes
+            and stored_hashes[document_id] == self.compute_content_hash(text, metadata)
+        }
     
     def search_similar(
         self,
@@ -167,6 +418,8 @@ class ChromaService:
         
         Performs a k-nearest neighbor search using cosine similarity to find
         the most relevant documents based on the query embedding.
+        With the result cache enabled, unfiltered searches may be answered
+        with a copy of a cached result.
         
         Args:
             query_embedding: Query embedding vector
@@ -195,64 +448,71 @@ class ChromaService:
         if not query_embedding or not isinstance(query_embedding, list):
             raise ValueError("query_embedding must be a non-empty list of floats")
         
+        query_vector = self._normalize(query_embedding)
+        
+        use_cache = self._result_cache is not None and where is None
+        if use_cache:
+            cached = self._result_cache.get(query_vector)
+            if cached is not None:
+                logger.info("Search served from result cache (%d results)", cached["count"])
+                return self._copy_results(cached)
+        generation = self._write_generation
+        
+        include = ["documents", "metadatas", "distances"]
+        if self.exact_rerank:
+            include.append("embeddings")
+        
         try:
             # Request more results to account for duplicate files
             results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=self.num_results * 10,
+                query_embeddings=[query_vector],
+                n_results=self.num_results * self.overfetch_factor,
                 where=where,
-                include=["documents", "metadatas", "distances"]
+                include=include
             )
 
             documents = results.get("documents", [[]])[0]
             metadatas = results.get("metadatas", [[]])[0]
             distances = results.get("distances", [[]])[0]
 
-            # Deduplicate by file_id (from metadata), keeping the best chunk per file
-            seen_file_ids = {}
-            unique_docs = []
-            unique_metas = []
-            unique_dists = []
+            if self.exact_rerank and documents:
+                documents, metadatas, distances = self._rerank_exact(
+                    query_vector,
+                    documents,
+                    metadatas,
+                    results["embeddings"][0]
+                )
 
-            for doc, meta, dist in zip(documents, metadatas, distances):
-                # Get the file_id from metadata
-                file_id = meta.get('file_id')
-                
-                # Skip if no file_id in metadata
-                if file_id is None:
-                    logger.warning("Document missing file_id in metadata, skipping")
-                    continue
-                
-                # Keep only the chunk with the lowest distance for each file
-                if file_id not in seen_file_ids:
-                    # First chunk from this file - add it
-                    seen_file_ids[file_id] = len(unique_docs)
-                    unique_docs.append(doc)
-                    unique_metas.append(meta)
-                    unique_dists.append(dist)
-                elif dist < unique_dists[seen_file_ids[file_id]]:
-                    # Better chunk from same file - replace it
-                    idx = seen_file_ids[file_id]
-                    unique_docs[idx] = doc
-                    unique_metas[idx] = meta
-                    unique_dists[idx] = dist
-                
-                # Stop once we have enough unique files
-                if len(seen_file_ids) >= self.num_results:
-                    break
+            # Deduplicate by file_id (from metadata), keeping the best chunk per file
+            keep, unique_count = self._best_chunk_per_file(metadatas, distances)
+            keep = np.asarray(keep[:self.num_results], dtype=np.int64)
 
+            # Gather the kept candidates with one fancy-indexing step per field
             formatted_results = {
-                "documents": unique_docs[:self.num_results],
-                "metadatas": unique_metas[:self.num_results],
-                "distances": unique_dists[:self.num_results],
-                "count": len(unique_docs[:self.num_results])
+                "documents": self._take(documents, keep),
+                "metadatas": [
+                    self._public_metadata(metadata)
+                    for metadata in self._take(metadatas, keep)
+                ],
+                "distances": np.asarray(distances, dtype=np.float64)[keep].tolist(),
+                "count": len(keep)
             }
             
             logger.info(
                 "Search completed: found %d unique files from %d total chunks",
-                len(unique_docs),
+                unique_count,
                 len(documents)
             )
+            
+            if use_cache:
+                # Compared under the lock that bumps the generation, so a
+                # write finishing meanwhile cannot leave stale results cached
+                with self._result_cache_lock:
+                    if generation == self._write_generation:
+                        self._result_cache.put(
+                            query_vector, self._copy_results(formatted_results)
+                        )
+            
             return formatted_results
             
         except Exception as e:
@@ -282,6 +542,7 @@ class ChromaService:
         
         try:
             self.collection.delete(ids=[document_id])
+            self._invalidate_result_cache()
             logger.info("Deleted document '%s' from ChromaDB", document_id)
             return True
             
@@ -294,6 +555,44 @@ class ChromaService:
             )
             return False
     
+    def delete_by_filter(self, where: Dict[str, Any]) -> int:
+        """
+        Delete every document whose metadata matches a filter.
+        
+        Args:
+            where: ChromaDB metadata filter (e.g., {"file_id": 42})
+            
+        Returns:
+            Number of documents deleted
+            
+        Raises:
+            ChromaServiceError: If deletion fails
+            ValueError: If where is empty
+            
+        Example:
+            >>> deleted = service.delete_by_filter({"file_id": 42})
+        """
+        if not where or not isinstance(where, dict):
+            raise ValueError("where must be a non-empty dict")
+        
+        try:
+            document_ids = self.collection.get(where=where, include=[])["ids"]
+            if document_ids:
+                self.collection.delete(ids=document_ids)
+                self._invalidate_result_cache()
+            
+            logger.info("Deleted %d documents matching %s from ChromaDB", len(document_ids), where)
+            return len(document_ids)
+            
+        except Exception as e:
+            logger.error(
+                "Failed to delete documents matching %s: %s",
+                where,
+                str(e),
+                exc_info=True
+            )
+            raise ChromaServiceError(f"Failed to delete documents: {str(e)}") from e
+    
     def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a specific document by ID.
@@ -322,7 +621,7 @@ class ChromaService:
             return {
                 "id": results["ids"][0],
                 "document": results["documents"][0],
-                "metadata": results["metadatas"][0],
+                "metadata": self._public_metadata(results["metadatas"][0]),
                 "embedding": results["embeddings"][0]
             }
             
@@ -339,6 +638,9 @@ class ChromaService:
                 - collection_name: Name of the collection
                 - document_count: Total number of documents
                 - persist_directory: Storage directory path
+                - similarity_metric: HNSW distance space
+                - hnsw_config: HNSW index parameters
+                - hnsw_recommended: Parameters suited to the current size
                 
         Example:
             >>> stats = service.get_collection_stats()
@@ -351,7 +653,9 @@ class ChromaService:
                 "collection_name": self.collection_name,
                 "document_count": count,
                 "persist_directory": self.persist_directory,
-                "similarity_metric": self.DEFAULT_SIMILARITY_METRIC
+                "similarity_metric": self.similarity_metric,
+                "hnsw_config": self.hnsw_config,
+                "hnsw_recommended": self.auto_configure_hnsw(count)
             }
             
         except Exception as e:
@@ -363,6 +667,32 @@ class ChromaService:
                 "error": str(e)
             }
     
+    def count_unique_files(self) -> int:
+        """
+        Count distinct 'file_id' metadata values across the collection.
+        
+        Only metadata is fetched, so document texts and embeddings are not
+        loaded.
+        
+        Returns:
+            Number of distinct source files
+            
+        Raises:
+            ChromaServiceError: If the collection cannot be read
+        """
+        try:
+            metadatas = self.collection.get(include=["metadatas"])["metadatas"]
+            
+            return len({
+                metadata["file_id"]
+                for metadata in metadatas
+                if metadata and "file_id" in metadata
+            })
+            
+        except Exception as e:
+            logger.error("Failed to count unique files: %s", str(e), exc_info=True)
+            raise ChromaServiceError(f"Failed to count unique files: {str(e)}") from e
+    
     def clear_collection(self) -> bool:
         """
         Clear all documents from the collection.
@@ -373,11 +703,12 @@ class ChromaService:
             True if successful, False otherwise
         """
         try:
-            # Get all document IDs
-            all_ids = self.collection.get()["ids"]
+            # Get all document IDs only, without texts, metadata or embeddings
+            all_ids = self.collection.get(include=[])["ids"]
             
             if all_ids:
                 self.collection.delete(ids=all_ids)
+                self._invalidate_result_cache()
                 logger.warning("Cleared %d documents from collection '%s'", len(all_ids), self.collection_name)
             
             return True
@@ -386,6 +717,273 @@ class ChromaService:
             logger.error("Failed to clear collection: %s", str(e), exc_info=True)
             return False
     
+    def _open_collection(self, name: str, index_metadata: Dict[str, Any]) -> Any:
+        """
+        Open an existing collection, or create it with the given index parameters.
+        
+        get_or_create_collection() would overwrite the metadata of an existing
+        collection, relabelling an index whose distance space and parameters
+        cannot change, so the metadata is only passed when creating.
+        
+        Args:
+            name: Collection name
+            index_metadata: HNSW metadata for a new collection
+            
+        Returns:
+            ChromaDB collection instance
+        """
+        try:
+            collection = self.client.get_collection(name=name)
+        except ValueError:
+            try:
+                return self.client.create_collection(name=name, metadata=index_metadata)
+            except ValueError:
+                # Created concurrently by another process
+                collection = self.client.get_collection(name=name)
+        
+        stored_metadata = collection.metadata or {}
+        mismatched = {
+            key: stored_metadata.get(key, self.CHROMA_HNSW_DEFAULTS[key])
+            for key, value in index_metadata.items()
+            if stored_metadata.get(key, self.CHROMA_HNSW_DEFAULTS[key]) != value
+        }
+        if mismatched:
+            logger.warning(
+                "Collection '%s' keeps the index parameters it was created with %s; "
+                "requested %s is ignored until the collection is recreated",
+                name,
+                mismatched,
+                {key: index_metadata[key] for key in mismatched}
+            )
+        
+        return collection
+    
+    def _invalidate_result_cache(self) -> None:
+        """Drop cached search results after the collection changed."""
+        with self._result_cache_lock:
+            self._write_generation += 1
+            if self._result_cache is not None:
+                self._result_cache.clear()
+    
+    @classmethod
+    def auto_configure_hnsw(cls, vector_count: int) -> Dict[str, int]:
+        """
+        Suggest HNSW index parameters for a collection size.
+        
+        Larger collections need more graph links and wider candidate lists to
+        keep recall up; small ones search faster with narrower settings.
+        Index parameters are fixed when a collection is created, so apply a
+        suggestion by recreating the collection with matching settings.
+        
+        Args:
+            vector_count: Number of vectors the collection holds or will hold
+            
+        Returns:
+            Dictionary with M, construction_ef and search_ef
+            
+        Example:
+            >>> ChromaService.auto_configure_hnsw(50_000)
+            {'M': 24, 'construction_ef': 200, 'search_ef': 100}
+        """
+        for max_count, m, construction_ef, search_ef in cls.HNSW_TIERS:
+            if max_count is None or vector_count <= max_count:
+                return {"M": m, "construction_ef": construction_ef, "search_ef": search_ef}
+    
+    @classmethod
+    def compute_content_hash(
+        cls,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Compute a SHA-256 fingerprint of document text and metadata.
+        
+        Args:
+            text: Document text content
+            metadata: Optional document metadata (the stored hash key is ignored)
+            
+        Returns:
+            Hex digest of the content hash
+        """
+        metadata = {
+            key: value
+            for key, value in (metadata or {}).items()
+            if key != cls.CONTENT_HASH_KEY
+        }
+        hasher = hashlib.sha256(text.encode("utf-8"))
+        hasher.update(json.dumps(metadata, sort_keys=True, default=str).encode("utf-8"))
+        return hasher.hexdigest()
+    
+    @classmethod
+    def _public_metadata(cls, metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Remove the internal content hash from stored metadata.
+        
+        Args:
+            metadata: Metadata as stored in the collection
+            
+        Returns:
+            Metadata as supplied by the caller
+        """
+        if not metadata or cls.CONTENT_HASH_KEY not in metadata:
+            return metadata
+        
+        return {key: value for key, value in metadata.items() if key != cls.CONTENT_HASH_KEY}
+    
+    @staticmethod
+    def _copy_results(results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy search results so callers and the result cache never share lists.
+        
+        Args:
+            results: Formatted search results
+            
+        Returns:
+            Copy with new result lists and metadata dicts
+        """
+        return {
+            "documents": list(results["documents"]),
+            "metadatas": [
+                dict(metadata) if metadata else metadata
+                for metadata in results["metadatas"]
+            ],
+            "distances": list(results["distances"]),
+            "count": results["count"]
+        }
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> List[float]:
+        """
+        L2-normalize an embedding so cosine similarity equals the inner product.
+        
+        Args:
+            embedding: Embedding vector
+            
+        Returns:
+            Unit-length embedding (unchanged if its norm is zero)
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        
+        if norm == 0.0:
+            return vector.tolist()
+        
+        return (vector / norm).tolist()
+    
+    @staticmethod
+    def _best_chunk_per_file(
+        metadatas: List[Dict[str, Any]],
+        distances: List[float]
+    ) -> Tuple[List[int], int]:
+        """
+        Select the nearest chunk of each file among search candidates.
+        
+        Candidates are sorted by distance once, and np.unique on the sorted
+        file codes yields each file's first (nearest) position in one pass.
+        
+        Args:
+            metadatas: Candidate metadata dicts (chunks without 'file_id' are skipped)
+            distances: Candidate distances
+            
+        Returns:
+            Tuple of (candidate indices nearest first, number of unique files)
+        """
+        file_codes: Dict[Any, int] = {}
+        candidates = []
+        codes = []
+        
+        for index, metadata in enumerate(metadatas):
+            file_id = (metadata or {}).get("file_id")
+            if file_id is None:
+                continue
+            candidates.append(index)
+            codes.append(file_codes.setdefault(file_id, len(file_codes)))
+        
+        if len(candidates) < len(metadatas):
+            logger.warning(
+                "%d documents missing file_id in metadata, skipping",
+                len(metadatas) - len(candidates)
+            )
+        
+        if not candidates:
+            return [], 0
+        
+        candidate_array = np.asarray(candidates, dtype=np.int64)
+        order = np.argsort(np.asarray(distances)[candidate_array], kind="stable")
+        _, first = np.unique(np.asarray(codes, dtype=np.int64)[order], return_index=True)
+        
+        return candidate_array[order[np.sort(first)]].tolist(), len(file_codes)
+    
+    @staticmethod
+    def _take(values: List[Any], indices: np.ndarray) -> List[Any]:
+        """
+        Select list items by an index array.
+        
+        Args:
+            values: Items to select from (any Python objects)
+            indices: Positions to select, in output order
+            
+        Returns:
+            Selected items
+        """
+        # Filled element-wise so dicts and strings are never unpacked by NumPy
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array[indices].tolist()
+    
+    @classmethod
+    def _rerank_exact(
+        cls,
+        query_vector: List[float],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        embeddings: List[List[float]]
+    ) -> Tuple[List[str], List[Dict[str, Any]], List[float]]:
+        """
+        Re-score search candidates exactly and sort them by distance.
+        
+        Candidate rows are normalized first, since collections written before
+        embeddings were normalized may hold raw vectors; one matrix-vector
+        product with the unit-length query then gives exact cosine distances.
+        
+        Args:
+            query_vector: Normalized query embedding
+            documents: Candidate document texts
+            metadatas: Candidate metadata dicts
+            embeddings: Candidate embeddings, as stored
+            
+        Returns:
+            Tuple of (documents, metadatas, distances), nearest first
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        distances = 1.0 - (matrix / norms) @ np.asarray(query_vector, dtype=np.float32)
+        order = np.argsort(distances, kind="stable")
+        
+        return (
+            cls._take(documents, order),
+            cls._take(metadatas, order),
+            distances[order].tolist()
+        )
+    
+    @staticmethod
+    def _normalize_batch(embeddings: List[List[float]]) -> List[List[float]]:
+        """
+        L2-normalize several equal-length embeddings at once.
+        
+        Args:
+            embeddings: Embedding vectors
+            
+        Returns:
+            Unit-length embeddings (zero vectors left unchanged)
+        """
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        
+        return (matrix / norms).tolist()
+    
     def __repr__(self) -> str:
         """String representation of the service."""
         return (
@@ -0,0 +1,255 @@
+"""
+Micro-Batcher Module.
+
+This module provides an asyncio micro-batcher that collects items submitted by
+concurrent requests for a short window and processes them with one batched
+call, e.g. coalescing single-text embedding requests into one Ollama call.
+
+Key Features:
+- Batches flushed when full or after a maximum wait
+- Per-item futures, so each caller awaits only its own result
+- Several batches may be in flight at once
+- Failed batches retried item by item, so one bad item fails only its caller
+"""
+
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """
+    Coalesce concurrently submitted items into batched calls.
+
+    Attributes:
+        max_batch_size: Maximum number of items per batch
+        max_wait_ms: Maximum time to wait for a batch to fill (milliseconds)
+    """
+
+    # Constants
+    DEFAULT_MAX_BATCH_SIZE = 32
+    DEFAULT_MAX_WAIT_MS = 10.0
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[ItemT]], Awaitable[List[ResultT]]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch: Coroutine function returning one result per item,
+                in order
+            max_batch_size: Maximum number of items per batch
+            max_wait_ms: Maximum time to wait for a batch to fill (milliseconds)
+
+        Raises:
+            ValueError: If max_batch_size or max_wait_ms is invalid
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be non-negative")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._process_batch = process_batch
+
+        self._queue: Optional["asyncio.Queue[Tuple[ItemT, asyncio.Future]]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def submit(self, item: ItemT) -> ResultT:
+        """
+        Submit an item and wait for its result.
+
+        Args:
+            item: Item to process
+
+        Returns:
+            Result for this item
+
+        Raises:
+            Exception: Whatever the batch processing call raised
+        """
+        if self._worker is None:
+            self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop."""
+        if self._worker is not None:
+            return
+
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._collect_batches())
+        logger.info(
+            "Micro-batcher started (max_batch_size: %d, max_wait_ms: %.1f)",
+            self.max_batch_size,
+            self.max_wait_ms
+        )
+
+    async def stop(self) -> None:
+        """
+        Stop batching and wait for in-flight batches to finish.
+
+        Callers whose items were queued or still being collected into a batch
+        get a RuntimeError instead of waiting forever.
+        """
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+        try:
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+        finally:
+            # Fail anything still queued so no caller waits forever
+            queued = []
+            while not self._queue.empty():
+                queued.append(self._queue.get_nowait())
+            self._fail_stopped(queued)
+
+            self._worker = None
+            self._queue = None
+            logger.info("Micro-batcher stopped")
+
+    async def _collect_batches(self) -> None:
+        """Gather queued items into batches and dispatch each batch."""
+        loop = asyncio.get_running_loop()
+        max_wait = self.max_wait_ms / 1000
+
+        batch: List[Tuple[ItemT, asyncio.Future]] = []
+
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + max_wait
+
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                task = loop.create_task(self._dispatch(batch))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+                batch = []
+        finally:
+            # Items taken off the queue but not yet dispatched when cancelled
+            self._fail_stopped(batch)
+
+    async def _dispatch(self, batch: List[Tuple[ItemT, asyncio.Future]]) -> None:
+        """
+        Process one batch and resolve its futures.
+
+        Args:
+            batch: Items paired with the futures of their callers
+        """
+        # Skip items whose callers have gone away
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        logger.debug("Dispatching micro-batch of %d items", len(batch))
+
+        try:
+            results = await self._process_items([item for item, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                self._resolve(batch[0][1], error=e)
+                return
+
+            # Retry each item alone so an invalid item only fails its caller
+            logger.warning(
+                "Micro-batch of %d items failed (%s), retrying items individually",
+                len(batch),
+                str(e)
+            )
+            await asyncio.gather(*(self._dispatch([entry]) for entry in batch))
+            return
+
+        for (_, future), result in zip(batch, results):
+            self._resolve(future, result=result)
+
+    async def _process_items(self, items: List[ItemT]) -> List[ResultT]:
+        """
+        Run the batch processing call and check its result count.
+
+        Args:
+            items: Items to process
+
+        Returns:
+            One result per item, in order
+
+        Raises:
+            RuntimeError: If the call returned the wrong number of results
+        """
+        results = await self._process_batch(items)
+        if len(results) != len(items):
+            raise RuntimeError(
+                f"Batch returned {len(results)} results for {len(items)} items"
+            )
+        return results
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future,
+        result: Optional[ResultT] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Complete a caller's future unless the caller has gone away.
+
+        Args:
+            future: Future the caller awaits
+            result: Result to set when error is None
+            error: Exception to set instead of a result
+        """
+        if future.done():
+            return
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    @staticmethod
+    def _fail_stopped(batch: List[Tuple[ItemT, asyncio.Future]]) -> None:
+        """
+        Fail the pending futures of items that will never be processed.
+
+        Args:
+            batch: Items paired with the futures of their callers
+        """
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("Micro-batcher stopped"))
+
+    def __repr__(self) -> str:
+        """String representation of the batcher."""
+        return (
+            f"MicroBatcher(max_batch_size={self.max_batch_size}, "
+            f"max_wait_ms={self.max_wait_ms})"
+        )
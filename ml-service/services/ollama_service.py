@@ -6,16 +6,27 @@ supporting text generation, embedding generation, and service health checks.
 
 Key Features:
 - Text generation with configurable parameters
-- Text embedding generation using embedding models
+- Text embedding generation using embedding models (L2-normalized vectors)
+- Blocking and asyncio (non-blocking) variants of generation and embedding
+- Pooled keep-alive connections shared by all async calls
+- Optional caps on concurrent async generation and embedding requests
+- Token streaming for generation
 - Service availability monitoring
 - Error handling and fallback mechanisms
 """
 
 
+import asyncio
 import hashlib
+import json
 import logging
-from typing import List, Optional
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+import httpx
 import requests
 from requests.exceptions import RequestException, Timeout
 
@@ -42,6 +53,43 @@ class OllamaEmbeddingError(OllamaServiceError):
     pass
 
 
+class _ConcurrencyLimiter:
+    """
+    Async context manager capping the number of concurrent holders.
+
+    The semaphore is created on first use, inside the running event loop,
+    because on Python 3.8/3.9 asyncio primitives bind to the loop that is
+    current when they are constructed.
+
+    Attributes:
+        limit: Maximum concurrent holders (0 = unlimited)
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            limit: Maximum concurrent holders (0 = unlimited)
+        """
+        self.limit = limit
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> None:
+        """Wait for a free slot, unless unlimited."""
+        if not self.limit:
+            return
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        await self._semaphore.acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Release the slot taken on entry."""
+        if self._semaphore is not None and self.limit:
+            self._semaphore.release()
+
+
 class OllamaService:
     """
     Service for interacting with Ollama LLM API.
@@ -55,6 +103,8 @@ class OllamaService:
         embedding_model: Name of the embedding model
         timeout_generate: Timeout for generation requests (seconds)
         timeout_embed: Timeout for embedding requests (seconds)
+        embedding_cache_size: Maximum number of cached embeddings (0 disables caching)
+        embedding_cache_ttl: Seconds a cached embedding stays valid (0 = no expiry)
     """
 
     # Constants
@@ -65,12 +115,23 @@ class OllamaService:
     TIMEOUT_GENERATE = 120
     TIMEOUT_EMBED = 60
     TIMEOUT_HEALTH = 10
+    TIMEOUT_CONNECT = 5
+    DEFAULT_EMBEDDING_CACHE_SIZE = 1000
+    MAX_CONNECTIONS = 256
+    MAX_KEEPALIVE_CONNECTIONS = 128
+    EMBED_ENDPOINT = "/api/embed"
+    LEGACY_EMBED_ENDPOINT = "/api/embeddings"
 
     def __init__(
         self, 
         host: str = "http://localhost:11434", 
         model: str = "mistral",
-        embedding_model: str = DEFAULT_EMBEDDING_MODEL
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+        embedding_cache_ttl: float = 0.0,
+        async_client: Optional[httpx.AsyncClient] = None,
+        max_concurrent_generations: int = 0,
+        max_concurrent_embeddings: int = 0
     ) -> None:
         """
         Initialize Ollama service client.
@@ -79,9 +140,17 @@ class OllamaService:
             host: Ollama service endpoint URL
             model: LLM model name (e.g., 'mistral', 'llama3.2:1b')
             embedding_model: Embedding model name (default: 'nomic-embed-text')
+            embedding_cache_size: Maximum number of cached embeddings (0 disables caching)
+            embedding_cache_ttl: Seconds a cached embedding stays valid (0 = no expiry)
+            async_client: Optional shared HTTP client for async calls; a pooled
+                client is created on first use if omitted
+            max_concurrent_generations: Maximum in-flight async generation
+                requests; excess requests wait (0 = unlimited)
+            max_concurrent_embeddings: Maximum in-flight async embedding
+                requests; excess requests wait (0 = unlimited)
             
         Raises:
-            ValueError: If host or model is invalid
+            ValueError: If host, model or a limit is invalid
         """
         if not host or not isinstance(host, str):
             raise ValueError("host must be a non-empty string")
@@ -89,11 +158,39 @@ class OllamaService:
         if not model or not isinstance(model, str):
             raise ValueError("model must be a non-empty string")
         
+        if embedding_cache_size < 0:
+            raise ValueError("embedding_cache_size must be non-negative")
+        
+        if embedding_cache_ttl < 0:
+            raise ValueError("embedding_cache_ttl must be non-negative")
+        
+        if max_concurrent_generations < 0 or max_concurrent_embeddings < 0:
+            raise ValueError("concurrency limits must be non-negative")
+        
         self.host = host.rstrip('/')
         self.model = model
         self.embedding_model = embedding_model
         self.timeout_generate = self.TIMEOUT_GENERATE
         self.timeout_embed = self.TIMEOUT_EMBED
+        self.embedding_cache_size = embedding_cache_size
+        self.embedding_cache_ttl = embedding_cache_ttl
+
+        # LRU cache of (expiry, embedding) keyed by (embedding_model, SHA-256 of
+        # text), so long document texts are not kept alive as keys
+        self._embedding_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, List[float]]]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+
+        # Cleared once Ollama (< 0.3) turns out not to serve /api/embed, so
+        # later calls go straight to the legacy endpoint
+        self._embed_endpoint_supported = True
+
+        # Pooled client reused by all async calls; only closed here if owned
+        self._async_client = async_client
+        self._owns_async_client = async_client is None
+
+        # Queue excess async requests here instead of overloading Ollama
+        self._generation_slots = _ConcurrencyLimiter(max_concurrent_generations)
+        self._embedding_slots = _ConcurrencyLimiter(max_concurrent_embeddings)
 
         logger.info(
             "Ollama service initialized (host: %s, model: %s, embedding: %s)",
@@ -133,30 +230,10 @@ class OllamaService:
             ...     max_tokens=200
             ... )
         """
-        # Validate inputs
-        if not prompt or not isinstance(prompt, str):
-            raise ValueError("prompt must be a non-empty string")
-        
-        if not 0.0 <= temperature <= 2.0:
-            raise ValueError("temperature must be between 0.0 and 2.0")
-        
-        if not 1 <= max_tokens <= 4096:
-            raise ValueError("max_tokens must be between 1 and 4096")
-        
         url = f"{self.host}/api/generate"
-        
-        # Format prompt with system message if provided
-        full_prompt = self._format_prompt(prompt, system_prompt)
-        
-        payload = {
-            "model": self.model,
-            "prompt": full_prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens
-            }
-        }
+        payload = self._build_generate_payload(
+            prompt, system_prompt, temperature, max_tokens
+        )
         
         try:
             logger.debug(
@@ -173,14 +250,7 @@ class OllamaService:
             )
             response.raise_for_status()
             
-            result = response.json()
-            generated_text = result.get("response", "").strip()
-            
-            if not generated_text:
-                raise OllamaGenerationError("Empty response from Ollama service")
-            
-            logger.debug("Generated %d characters", len(generated_text))
-            return generated_text
+            return self._parse_generate_response(response.json())
             
         except Timeout as e:
             logger.error("Generation timeout after %ds", self.timeout_generate)
@@ -194,12 +264,153 @@ class OllamaService:
             logger.error("Unexpected error during generation: %s", str(e), exc_info=True)
             raise OllamaGenerationError(f"Unexpected error: {str(e)}") from e
     
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = DEFAULT_TEMPERATURE,
+        max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> str:
+        """
+        Generate text using Ollama LLM without blocking the event loop.
+        
+        Asynchronous counterpart of generate() for use in async request handlers.
+        
+        Args:
+            prompt: The input prompt for text generation
+            system_prompt: Optional system prompt to guide generation behavior
+            temperature: Sampling temperature (0.0-2.0). Higher = more random
+            max_tokens: Maximum number of tokens to generate
+            
+        Returns:
+            Generated text string
+            
+        Raises:
+            OllamaGenerationError: If generation fails
+            ValueError: If inputs are invalid
+            
+        Example:
+            >>> text = await service.agenerate(prompt="Explain machine learning")
+        """
+        url = f"{self.host}/api/generate"
+        payload = self._build_generate_payload(
+            prompt, system_prompt, temperature, max_tokens
+        )
+        
+        try:
+            logger.debug(
+                "Generating text async (model: %s, temperature: %.2f, max_tokens: %d)",
+                self.model,
+                temperature,
+                max_tokens
+            )
+            
+            async with self._generation_slots:
+                response = await self._get_async_client().post(
+                    url, json=payload, timeout=self.timeout_generate
+                )
+            response.raise_for_status()
+            
+            return self._parse_generate_response(response.json())
+            
+        except httpx.TimeoutException as e:
+            logger.error("Generation timeout after %ds", self.timeout_generate)
+            raise OllamaGenerationError(
+                f"Generation timeout after {self.timeout_generate}s"
+            ) from e
+        except httpx.HTTPError as e:
+            logger.error("Generation request failed: %s", str(e), exc_info=True)
+            raise OllamaGenerationError(f"Failed to generate text: {str(e)}") from e
+        except Exception as e:
+            logger.error("Unexpected error during generation: %s", str(e), exc_info=True)
+            raise OllamaGenerationError(f"Unexpected error: {str(e)}") from e
+    
+    async def astream_generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = DEFAULT_TEMPERATURE,
+        max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text from Ollama LLM as it is produced.
+        
+        Args:
+            prompt: The input prompt for text generation
+            system_prompt: Optional system prompt to guide generation behavior
+            temperature: Sampling temperature (0.0-2.0). Higher = more random
+            max_tokens: Maximum number of tokens to generate
+            
+        Yields:
+            Generated text fragments in order
+            
+        Raises:
+            OllamaGenerationError: If generation fails
+            ValueError: If inputs are invalid
+            
+        Example:
+            >>> async for token in service.astream_generate(prompt="Explain AI"):
+            ...     print(token, end="")
+        """
+        url = f"{self.host}/api/generate"
+        payload = self._build_generate_payload(
+            prompt, system_prompt, temperature, max_tokens
+        )
+        payload["stream"] = True
+        
+        try:
+            logger.debug(
+                "Streaming text (model: %s, temperature: %.2f, max_tokens: %d)",
+                self.model,
+                temperature,
+                max_tokens
+            )
+            
+            async with self._generation_slots, self._get_async_client().stream(
+                "POST", url, json=payload, timeout=self.timeout_generate
+            ) as response:
+                response.raise_for_status()
+                
+                # Ollama streams one JSON object per line
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise OllamaGenerationError(chunk["error"])
+                    
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    
+                    if chunk.get("done"):
+                        break
+            
+        except OllamaGenerationError:
+            raise
+        except httpx.TimeoutException as e:
+            logger.error("Generation stream timeout after %ds", self.timeout_generate)
+            raise OllamaGenerationError(
+                f"Generation timeout after {self.timeout_generate}s"
+            ) from e
+        except httpx.HTTPError as e:
+            logger.error("Generation stream failed: %s", str(e), exc_info=True)
+            raise OllamaGenerationError(f"Failed to generate text: {str(e)}") from e
+        except Exception as e:
+            logger.error("Unexpected error during generation stream: %s", str(e), exc_info=True)
+            raise OllamaGenerationError(f"Unexpected error: {str(e)}") from e
+    
     def embed_text(self, text: str) -> List[float]:
         """
         Generate text embedding vector using Ollama embedding model.
         
-        Falls back to simple hash-based embedding if the embedding model
-        is not available.
+        Results are served from an in-memory LRU cache when the same text
+        was embedded recently. Uses the same /api/embed endpoint as
+        embed_texts(), so a text gets the same L2-normalized vector whether
+        or not it was batched; Ollama versions without it are served by the
+        legacy /api/embeddings endpoint. Falls back to simple hash-based
+        embedding if the embedding model is not available (fallback vectors
+        are not cached).
         
         Args:
             text: Text to generate embedding for
@@ -218,36 +429,100 @@ class OllamaService:
         if not text or not isinstance(text, str):
             raise ValueError("text must be a non-empty string")
         
-        url = f"{self.host}/api/embeddings"
-        
-        payload = {
-            "model": self.embedding_model,
-            "prompt": text
-        }
+        cached = self._get_cached_embedding(text)
+        if cached is not None:
+            logger.debug("Embedding cache hit (length: %d)", len(text))
+            return cached
         
         try:
             logger.debug("Generating embedding for text (length: %d)", len(text))
             
+            if self._embed_endpoint_supported:
+                response = requests.post(
+                    f"{self.host}{self.EMBED_ENDPOINT}",
+                    json=self._build_embed_payload([text]),
+                    timeout=self.timeout_embed
+                )
+                if not self._mark_embed_endpoint_missing(response):
+                    response.raise_for_status()
+                    return self._merge_batch_embeddings(
+                        [text], [None], [0], response.json()
+                    )[0]
+            
             response = requests.post(
-                url, 
-                json=payload, 
+                f"{self.host}{self.LEGACY_EMBED_ENDPOINT}",
+                json=self._build_legacy_embed_payload(text),
                 timeout=self.timeout_embed
             )
             response.raise_for_status()
             
-            result = response.json()
-            embedding = result.get("embedding", [])
+            return self._parse_embedding_response(text, response.json())
+            
+        except (RequestException, Timeout) as e:
+            logger.warning(
+                "Ollama embedding failed: %s, using fallback method", 
+                str(e)
+            )
+            return self._simple_embedding(text)
+        except Exception as e:
+            logger.error(
+                "Unexpected error during embedding: %s, using fallback", 
+                str(e), 
+                exc_info=True
+            )
+            return self._simple_embedding(text)
+
+    async def aembed_text(self, text: str) -> List[float]:
+        """
+        Generate text embedding vector without blocking the event loop.
+        
+        Asynchronous counterpart of embed_text(), sharing its cache and
+        hash-based fallback behaviour.
+        
+        Args:
+            text: Text to generate embedding for
+            
+        Returns:
+            Embedding vector as list of floats
             
-            if not embedding:
-                logger.warning(
-                    "Empty embedding from Ollama, using fallback method"
+        Raises:
+            ValueError: If text is invalid
+        """
+        if not text or not isinstance(text, str):
+            raise ValueError("text must be a non-empty string")
+        
+        cached = self._get_cached_embedding(text)
+        if cached is not None:
+            logger.debug("Embedding cache hit (length: %d)", len(text))
+            return cached
+        
+        try:
+            logger.debug("Generating embedding async for text (length: %d)", len(text))
+            
+            if self._embed_endpoint_supported:
+                async with self._embedding_slots:
+                    response = await self._get_async_client().post(
+                        f"{self.host}{self.EMBED_ENDPOINT}",
+                        json=self._build_embed_payload([text]),
+                        timeout=self.timeout_embed
+                    )
+                if not self._mark_embed_endpoint_missing(response):
+                    response.raise_for_status()
+                    return self._merge_batch_embeddings(
+                        [text], [None], [0], response.json()
+                    )[0]
+            
+            async with self._embedding_slots:
+                response = await self._get_async_client().post(
+                    f"{self.host}{self.LEGACY_EMBED_ENDPOINT}",
+                    json=self._build_legacy_embed_payload(text),
+                    timeout=self.timeout_embed
                 )
-                return self._simple_embedding(text)
+            response.raise_for_status()
             
-            logger.debug("Generated embedding (dimension: %d)", len(embedding))
-            return embedding
+            return self._parse_embedding_response(text, response.json())
             
-        except (RequestException, Timeout) as e:
+        except httpx.HTTPError as e:
             logger.warning(
                 "Ollama embedding failed: %s, using fallback method", 
                 str(e)
@@ -260,7 +535,122 @@ class OllamaService:
                 exc_info=True
             )
             return self._simple_embedding(text)
-    
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embedding vectors for multiple texts in a single request.
+
+        Cached texts are served from the LRU cache; the remaining texts are
+        sent to Ollama's batch endpoint in one call. Falls back to embedding
+        texts individually if the batch request fails.
+
+        Args:
+            texts: Texts to generate embeddings for
+
+        Returns:
+            Embedding vectors in the same order as the input texts
+
+        Raises:
+            ValueError: If texts is empty or contains invalid entries
+
+        Example:
+            >>> service = OllamaService()
+            >>> embeddings = service.embed_texts(["First text", "Second text"])
+            >>> print(len(embeddings))  # 2
+        """
+        embeddings, missing = self._lookup_cached_embeddings(texts)
+
+        if not missing:
+            return embeddings
+
+        if not self._embed_endpoint_supported:
+            for i in missing:
+                embeddings[i] = self.embed_text(texts[i])
+            return embeddings
+
+        try:
+            logger.debug(
+                "Generating batch embeddings (batch_size: %d, cached: %d)",
+                len(missing),
+                len(texts) - len(missing)
+            )
+
+            response = requests.post(
+                f"{self.host}{self.EMBED_ENDPOINT}",
+                json=self._build_embed_payload([texts[i] for i in missing]),
+                timeout=self.timeout_embed
+            )
+            self._mark_embed_endpoint_missing(response)
+            response.raise_for_status()
+
+            return self._merge_batch_embeddings(
+                texts, embeddings, missing, response.json()
+            )
+
+        except Exception as e:
+            logger.warning(
+                "Ollama batch embedding failed: %s, embedding texts individually",
+                str(e)
+            )
+            for i in missing:
+                embeddings[i] = self.embed_text(texts[i])
+            return embeddings
+
+    async def aembed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts without blocking the event loop.
+
+        Asynchronous counterpart of embed_texts(), sharing its cache and
+        per-text fallback behaviour.
+
+        Args:
+            texts: Texts to generate embeddings for
+
+        Returns:
+            Embedding vectors in the same order as the input texts
+
+        Raises:
+            ValueError: If texts is empty or contains invalid entries
+        """
+        embeddings, missing = self._lookup_cached_embeddings(texts)
+
+        if not missing:
+            return embeddings
+
+        if not self._embed_endpoint_supported:
+            for i in missing:
+                embeddings[i] = await self.aembed_text(texts[i])
+            return embeddings
+
+        try:
+            logger.debug(
+                "Generating batch embeddings async (batch_size: %d, cached: %d)",
+                len(missing),
+                len(texts) - len(missing)
+            )
+
+            async with self._embedding_slots:
+                response = await self._get_async_client().post(
+                    f"{self.host}{self.EMBED_ENDPOINT}",
+                    json=self._build_embed_payload([texts[i] for i in missing]),
+                    timeout=self.timeout_embed
+                )
+            self._mark_embed_endpoint_missing(response)
+            response.raise_for_status()
+
+            return self._merge_batch_embeddings(
+                texts, embeddings, missing, response.json()
+            )
+
+        except Exception as e:
+            logger.warning(
+                "Ollama batch embedding failed: %s, embedding texts individually",
+                str(e)
+            )
+            for i in missing:
+                embeddings[i] = await self.aembed_text(texts[i])
+            return embeddings
+
     def is_available(self) -> bool:
         """
         Check if Ollama service is available and responsive.
@@ -291,6 +681,33 @@ class OllamaService:
             logger.debug("Ollama service not available: %s", str(e))
             return False
     
+    async def ais_available(self) -> bool:
+        """
+        Check if Ollama service is available without blocking the event loop.
+        
+        Asynchronous counterpart of is_available(), using the pooled client.
+        
+        Returns:
+            True if service is available, False otherwise
+        """
+        try:
+            response = await self._get_async_client().get(
+                f"{self.host}/api/tags",
+                timeout=self.TIMEOUT_HEALTH
+            )
+            is_up = response.status_code == 200
+            
+            if is_up:
+                logger.debug("Ollama service is available")
+            else:
+                logger.warning("Ollama service returned status %d", response.status_code)
+            
+            return is_up
+            
+        except Exception as e:
+            logger.debug("Ollama service not available: %s", str(e))
+            return False
+    
     def get_available_models(self) -> List[str]:
         """
         Get list of available models from Ollama service.
@@ -320,6 +737,250 @@ class OllamaService:
                 f"Failed to get available models: {str(e)}"
             ) from e
         
+    async def aclose(self) -> None:
+        """
+        Close the pooled async HTTP client if this service created it.
+        
+        A new client is created on the next async call, so the service
+        remains usable after closing.
+        """
+        if self._owns_async_client and self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            logger.info("Closed Ollama HTTP connection pool")
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled async HTTP client, creating it on first use.
+        
+        Returns:
+            Shared httpx.AsyncClient with keep-alive connections
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout_generate, connect=self.TIMEOUT_CONNECT),
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS
+                )
+            )
+            self._owns_async_client = True
+        return self._async_client
+    
+    def _build_generate_payload(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        Validate generation inputs and build the Ollama request payload.
+        
+        Args:
+            prompt: The input prompt for text generation
+            system_prompt: Optional system prompt
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum number of tokens to generate
+            
+        Returns:
+            JSON payload for the /api/generate endpoint
+            
+        Raises:
+            ValueError: If inputs are invalid
+        """
+        if not prompt or not isinstance(prompt, str):
+            raise ValueError("prompt must be a non-empty string")
+        
+        if not 0.0 <= temperature <= 2.0:
+            raise ValueError("temperature must be between 0.0 and 2.0")
+        
+        if not 1 <= max_tokens <= 4096:
+            raise ValueError("max_tokens must be between 1 and 4096")
+        
+        return {
+            "model": self.model,
+            # Format prompt with system message if provided
+            "prompt": self._format_prompt(prompt, system_prompt),
+            "stream": False,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
+    
+    def _parse_generate_response(self, result: Dict[str, Any]) -> str:
+        """
+        Extract generated text from an Ollama /api/generate response.
+        
+        Args:
+            result: Decoded JSON response
+            
+        Returns:
+            Generated text string
+            
+        Raises:
+            OllamaGenerationError: If the response is empty
+        """
+        generated_text = result.get("response", "").strip()
+        
+        if not generated_text:
+            raise OllamaGenerationError("Empty response from Ollama service")
+        
+        logger.debug("Generated %d characters", len(generated_text))
+        return generated_text
+    
+    def _build_embed_payload(self, texts: List[str]) -> Dict[str, Any]:
+        """
+        Build the request payload for the /api/embed endpoint.
+        
+        Args:
+            texts: Texts to generate embeddings for
+            
+        Returns:
+            JSON payload with all texts as one input batch
+        """
+        return {"model": self.embedding_model, "input": texts}
+    
+    def _build_legacy_embed_payload(self, text: str) -> Dict[str, Any]:
+        """
+        Build the request payload for the legacy /api/embeddings endpoint.
+        
+        Args:
+            text: Text to generate an embedding for
+            
+        Returns:
+            JSON payload for a single prompt
+        """
+        return {"model": self.embedding_model, "prompt": text}
+    
+    def _mark_embed_endpoint_missing(self, response: Any) -> bool:
+        """
+        Remember that Ollama does not serve /api/embed, if the response says so.
+        
+        An unknown route is answered with a plain-text 404, whereas a missing
+        model is reported as a JSON error, which must not disable the endpoint.
+        
+        Args:
+            response: requests or httpx response from /api/embed
+            
+        Returns:
+            True if the endpoint is missing
+        """
+        if response.status_code != 404 or response.text.lstrip().startswith("{"):
+            return False
+        
+        if self._embed_endpoint_supported:
+            logger.warning(
+                "Ollama does not support %s (requires 0.3+), using %s",
+                self.EMBED_ENDPOINT,
+                self.LEGACY_EMBED_ENDPOINT
+            )
+        self._embed_endpoint_supported = False
+        return True
+    
+    def _parse_embedding_response(
+        self,
+        text: str,
+        result: Dict[str, Any]
+    ) -> List[float]:
+        """
+        Extract and cache the embedding from an Ollama /api/embeddings response.
+        
+        The legacy endpoint returns raw vectors, so they are L2-normalized to
+        match /api/embed and share cache entries with it.
+        
+        Args:
+            text: Text the embedding was requested for
+            result: Decoded JSON response
+            
+        Returns:
+            Embedding vector, or the hash-based fallback if the response is empty
+        """
+        embedding = result.get("embedding", [])
+        
+        if not embedding:
+            logger.warning(
+                "Empty embedding from Ollama, using fallback method"
+            )
+            return self._simple_embedding(text)
+        
+        norm = math.sqrt(sum(value * value for value in embedding))
+        if norm:
+            embedding = [value / norm for value in embedding]
+        
+        logger.debug("Generated embedding (dimension: %d)", len(embedding))
+        self._cache_embedding(text, embedding)
+        return embedding
+    
+    def _lookup_cached_embeddings(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[Optional[List[float]]], List[int]]:
+        """
+        Validate batch input and resolve cached embeddings.
+        
+        Args:
+            texts: Texts to generate embeddings for
+            
+        Returns:
+            Tuple of (embeddings with None for cache misses, indices of misses)
+            
+        Raises:
+            ValueError: If texts is empty or contains invalid entries
+        """
+        if not texts or not isinstance(texts, list):
+            raise ValueError("texts must be a non-empty list of strings")
+        
+        if not all(text and isinstance(text, str) for text in texts):
+            raise ValueError("texts must only contain non-empty strings")
+        
+        embeddings: List[Optional[List[float]]] = [
+            self._get_cached_embedding(text) for text in texts
+        ]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if not missing:
+            logger.debug("Embedding cache hit for all %d texts", len(texts))
+        
+        return embeddings, missing
+    
+    def _merge_batch_embeddings(
+        self,
+        texts: List[str],
+        embeddings: List[Optional[List[float]]],
+        missing: List[int],
+        result: Dict[str, Any]
+    ) -> List[List[float]]:
+        """
+        Fill cache misses from an Ollama /api/embed response and cache them.
+        
+        Args:
+            texts: Texts the embeddings were requested for
+            embeddings: Partially filled embeddings (None for misses)
+            missing: Indices of the texts sent to Ollama
+            result: Decoded JSON response
+            
+        Returns:
+            Fully populated embeddings in input order
+            
+        Raises:
+            OllamaEmbeddingError: If the response does not match the request
+        """
+        batch_embeddings = result.get("embeddings", [])
+        
+        if len(batch_embeddings) != len(missing) or not all(batch_embeddings):
+            raise OllamaEmbeddingError(
+                f"Expected {len(missing)} embeddings, got {len(batch_embeddings)}"
+            )
+        
+        for i, embedding in zip(missing, batch_embeddings):
+            embeddings[i] = embedding
+            self._cache_embedding(texts[i], embedding)
+        
+        logger.debug("Generated %d embeddings in one batch", len(missing))
+        return embeddings
+    
     def _format_prompt(
         self, 
         prompt: str, 
@@ -343,6 +1004,72 @@ class OllamaService:
             )
         return prompt
     
+    def _embedding_cache_key(self, text: str) -> Tuple[str, bytes]:
+        """
+        Build the embedding cache key for a text.
+        
+        Args:
+            text: Text the embedding is generated for
+            
+        Returns:
+            Tuple of (embedding model, SHA-256 digest of the text)
+        """
+        return (self.embedding_model, hashlib.sha256(text.encode("utf-8")).digest())
+    
+    def _get_cached_embedding(self, text: str) -> Optional[List[float]]:
+        """
+        Look up a previously generated embedding.
+        
+        Args:
+            text: Text the embedding was generated for
+            
+        Returns:
+            Copy of the cached embedding, or None on a cache miss
+        """
+        if not self.embedding_cache_size:
+            return None
+        
+        key = self._embedding_cache_key(text)
+        with self._embedding_cache_lock:
+            entry = self._embedding_cache.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, embedding = entry
+            if expires_at < time.monotonic():
+                del self._embedding_cache[key]
+                return None
+            
+            self._embedding_cache.move_to_end(key)
+        
+        # Return a copy so callers cannot mutate the cached vector
+        return list(embedding)
+    
+    def _cache_embedding(self, text: str, embedding: List[float]) -> None:
+        """
+        Store an embedding, evicting the least recently used entry when full.
+        
+        Expired entries are dropped when they are next looked up.
+        
+        Args:
+            text: Text the embedding was generated for
+            embedding: Embedding vector to cache
+        """
+        if not self.embedding_cache_size:
+            return
+        
+        key = self._embedding_cache_key(text)
+        expires_at = (
+            time.monotonic() + self.embedding_cache_ttl
+            if self.embedding_cache_ttl
+            else float("inf")
+        )
+        with self._embedding_cache_lock:
+            self._embedding_cache[key] = (expires_at, list(embedding))
+            self._embedding_cache.move_to_end(key)
+            while len(self._embedding_cache) > self.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+    
     def _simple_embedding(self, text: str) -> List[float]:
         """
         Generate simple hash-based embedding as fallback.
@@ -0,0 +1,208 @@
+"""
+Semantic Cache Module.
+
+This module provides an in-memory cache keyed by embedding similarity rather
+than exact text, so near-identical inputs (e.g. rephrased search queries) can
+reuse a previously computed LLM response.
+
+Key Features:
+- Exact-key lookup before any similarity computation
+- Cosine-similarity lookup over L2-normalized embeddings
+- Configurable similarity threshold
+- Bounded size with least-recently-used eviction
+- Thread-safe access
+"""
+
+
+import logging
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Cache that returns stored values for embeddings similar to a lookup embedding.
+
+    Embeddings are normalized on insertion so a single matrix-vector product
+    yields the cosine similarity against every cached entry. Entries may also
+    carry an exact key (e.g. the query text) that is checked first, so
+    repeated identical inputs skip the similarity search entirely.
+
+    Attributes:
+        max_size: Maximum number of cached entries
+        threshold: Minimum cosine similarity required for a cache hit
+    """
+
+    # Constants
+    DEFAULT_MAX_SIZE = 1000
+    DEFAULT_THRESHOLD = 0.95
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        threshold: float = DEFAULT_THRESHOLD
+    ) -> None:
+        """
+        Initialize an empty semantic cache.
+
+        Args:
+            max_size: Maximum number of cached entries
+            threshold: Minimum cosine similarity (0.0-1.0) for a cache hit
+
+        Raises:
+            ValueError: If max_size or threshold is invalid
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError("threshold must be between 0.0 and 1.0")
+
+        self.max_size = max_size
+        self.threshold = threshold
+
+        # Storage is allocated on first insert, once the dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._last_used: Optional[np.ndarray] = None
+        self._values: List[Any] = []
+        self._keys: List[Optional[Hashable]] = []
+        self._rows_by_key: Dict[Hashable, int] = {}
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        embedding: Optional[List[float]] = None,
+        key: Optional[Hashable] = None
+    ) -> Optional[Any]:
+        """
+        Look up a value by exact key, then by the most similar cached embedding.
+
+        Args:
+            embedding: Optional lookup embedding vector
+            key: Optional exact key stored alongside an entry
+
+        Returns:
+            Cached value if the key matches or the best embedding match meets
+            the threshold, None otherwise
+        """
+        with self._lock:
+            row = self._rows_by_key.get(key) if key is not None else None
+            if row is not None:
+                self._clock += 1
+                self._last_used[row] = self._clock
+                logger.debug("Semantic cache exact hit")
+                return self._values[row]
+
+        if embedding is None:
+            return None
+
+        query = self._normalize(embedding)
+
+        with self._lock:
+            size = len(self._values)
+            if query is None or size == 0 or query.shape[0] != self._vectors.shape[1]:
+                return None
+
+            similarities = self._vectors[:size] @ query
+            best = int(np.argmax(similarities))
+
+            if similarities[best] < self.threshold:
+                return None
+
+            self._clock += 1
+            self._last_used[best] = self._clock
+            logger.debug("Semantic cache hit (similarity: %.3f)", similarities[best])
+            return self._values[best]
+
+    def put(
+        self,
+        embedding: List[float],
+        value: Any,
+        key: Optional[Hashable] = None
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            embedding: Embedding vector to key the value by
+            value: Value to cache
+            key: Optional exact key for lookups without an embedding
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_size, vector.shape[0]), dtype=np.float32)
+                self._last_used = np.zeros(self.max_size, dtype=np.int64)
+            elif vector.shape[0] != self._vectors.shape[1]:
+                logger.debug("Skipping semantic cache insert with mismatched dimension")
+                return
+
+            if key is not None and key in self._rows_by_key:
+                row = self._rows_by_key[key]
+                self._values[row] = value
+            elif len(self._values) < self.max_size:
+                row = len(self._values)
+                self._values.append(value)
+                self._keys.append(key)
+            else:
+                row = int(np.argmin(self._last_used))
+                evicted_key = self._keys[row]
+                if evicted_key is not None:
+                    del self._rows_by_key[evicted_key]
+                self._values[row] = value
+                self._keys[row] = key
+
+            if key is not None:
+                self._rows_by_key[key] = row
+
+            self._clock += 1
+            self._vectors[row] = vector
+            self._last_used[row] = self._clock
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._vectors = None
+            self._last_used = None
+            self._values = []
+            self._keys = []
+            self._rows_by_key = {}
+            self._clock = 0
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._values)
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        """
+        Convert an embedding to an L2-normalized float32 array.
+
+        Args:
+            embedding: Embedding vector
+
+        Returns:
+            Normalized vector, or None if the embedding is empty or zero
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector)) if vector.size else 0.0
+
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+
+        return vector / norm
+
+    def __repr__(self) -> str:
+        """String representation of the cache."""
+        return (
+            f"SemanticCache(size={len(self._values)}, max_size={self.max_size}, "
+            f"threshold={self.threshold})"
+        )
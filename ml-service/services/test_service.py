@@ -255,6 +255,73 @@ def test_embedding() -> TestResult:
         return TestResult("Embedding", False, f"Unexpected error: {str(e)}")
 
 
+def test_batch_embedding() -> TestResult:
+    """
+    Test the batched text embedding endpoint.
+    
+    Validates:
+        - Successful batch embedding generation
+        - One embedding is returned per input text
+        - All embeddings share the reported dimension
+    
+    Returns:
+        TestResult indicating success or failure
+    """
+    print_section("Testing Batch Text Embedding")
+    
+    payload = {
+        "texts": [
+            "This is the first test document",
+            "This is the second test document",
+            "This is the third test document"
+        ]
+    }
+    
+    try:
+        response = requests.post(
+            f"{BASE_URL}/embed/batch",
+            json=payload,
+            timeout=REQUEST_TIMEOUT
+        )
+        
+        if response.status_code != 200:
+            return TestResult(
+                "Batch Embedding",
+                False,
+                f"Status {response.status_code}: {response.text}"
+            )
+        
+        result = response.json()
+        
+        if result.get("count") != len(payload["texts"]):
+            return TestResult(
+                "Batch Embedding",
+                False,
+                f"Expected {len(payload['texts'])} embeddings, got {result.get('count')}"
+            )
+        
+        if any(len(embedding) != result["dimension"] for embedding in result["embeddings"]):
+            return TestResult(
+                "Batch Embedding",
+                False,
+                "Embedding dimension mismatch"
+            )
+        
+        print(f"Embeddings: {result['count']} x {result['dimension']}")
+        print(f"Processing time: {result['processing_time']:.2f}s")
+        
+        return TestResult(
+            "Batch Embedding",
+            True,
+            f"Generated {result['count']} embeddings in {result['processing_time']:.2f}s"
+        )
+        
+    except RequestException as e:
+        return TestResult("Batch Embedding", False, f"Request failed: {str(e)}")
+    except Exception as e:
+        return TestResult("Batch Embedding", False, f"Unexpected error: {str(e)}")
+
+
 def test_document_addition() -> TestResult:
     """
     Test adding documents to the vector database.
@@ -328,6 +395,74 @@ def test_document_addition() -> TestResult:
         return TestResult("Document Addition", False, f"Unexpected error: {str(e)}")
 
 
+def test_batch_document_addition() -> TestResult:
+    """
+    Test adding multiple documents in a single request.
+    
+    Validates:
+        - Batch addition returns success status
+        - All document IDs are returned
+    
+    Returns:
+        TestResult indicating success or failure
+    """
+    print_section("Testing Batch Document Addition")
+    
+    payload = {
+        "documents": [
+            {
+                "document_id": "test_batch_doc_1",
+                "text": "Computer vision enables machines to interpret images and video.",
+                "metadata": {"category": "CV", "source": "test"}
+            },
+            {
+                "document_id": "test_batch_doc_2",
+                "text": "Reinforcement learning trains agents through rewards and penalties.",
+                "metadata": {"category": "RL", "source": "test"}
+            }
+        ]
+    }
+    expected_ids = [doc["document_id"] for doc in payload["documents"]]
+    
+    try:
+        response = requests.post(
+            f"{BASE_URL}/documents/batch",
+            json=payload,
+            timeout=REQUEST_TIMEOUT
+        )
+        
+        if response.status_code != 200:
+            return TestResult(
+                "Batch Document Addition",
+                False,
+                f"Status {response.status_code}: {response.text}"
+            )
+        
+        result = response.json()
+        
+        # Documents left over from an earlier run come back as unchanged
+        returned_ids = result.get("document_ids", []) + result.get("unchanged_ids", [])
+        if sorted(returned_ids) != sorted(expected_ids):
+            return TestResult(
+                "Batch Document Addition",
+                False,
+                f"Unexpected document IDs: {returned_ids}"
+            )
+        
+        print(f"Added {result['count']} documents in {result['processing_time']:.2f}s")
+        
+        return TestResult(
+            "Batch Document Addition",
+            True,
+            f"Successfully added {result['count']} documents in one request"
+        )
+        
+    except RequestException as e:
+        return TestResult("Batch Document Addition", False, f"Request failed: {str(e)}")
+    except Exception as e:
+        return TestResult("Batch Document Addition", False, f"Unexpected error: {str(e)}")
+
+
 def test_search() -> TestResult:
     """
     Test semantic document search.
@@ -538,7 +673,10 @@ def cleanup_test_documents() -> None:
     """
     print_section("Cleaning Up Test Documents")
     
-    test_doc_ids = ["test_doc_1", "test_doc_2", "test_doc_3"]
+    test_doc_ids = [
+        "test_doc_1", "test_doc_2", "test_doc_3",
+        "test_batch_doc_1", "test_batch_doc_2"
+    ]
     
     for doc_id in test_doc_ids:
         try:
@@ -607,7 +745,9 @@ def run_all_tests() -> int:
         test_health_check,
         test_text_generation,
         test_embedding,
+        test_batch_embedding,
         test_document_addition,
+        test_batch_document_addition,
         test_search,
         test_summarization,
         test_stats,
@@ -0,0 +1,82 @@
+"""
+TTL Cache Module.
+
+This module provides a decorator that caches the result of an argument-less
+coroutine function for a fixed time-to-live, so bursts of concurrent callers
+(e.g. load balancer health probes) collapse into a single backend call.
+
+Key Features:
+- Time-based expiry using a monotonic clock
+- Concurrent callers coalesced behind an asyncio lock
+- Explicit invalidation for fast failure detection
+"""
+
+
+import asyncio
+import functools
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def async_ttl_cache(
+    ttl: float,
+) -> Callable[[Callable[[], Awaitable[T]]], Callable[[], Awaitable[T]]]:
+    """
+    Cache the result of an argument-less coroutine function for ``ttl`` seconds.
+
+    The decorated function gains an ``invalidate()`` attribute that discards
+    the cached value so the next call reaches the backend again.
+
+    Args:
+        ttl: Time-to-live of a cached result in seconds
+
+    Returns:
+        Decorator wrapping the coroutine function
+
+    Raises:
+        ValueError: If ttl is negative
+
+    Example:
+        >>> @async_ttl_cache(ttl=2.0)
+        ... async def fetch_status() -> bool:
+        ...     return True
+        >>> fetch_status.invalidate()
+    """
+    if ttl < 0:
+        raise ValueError("ttl must be non-negative")
+
+    def decorator(func: Callable[[], Awaitable[T]]) -> Callable[[], Awaitable[T]]:
+        state: dict = {"value": None, "expires_at": 0.0}
+        lock: Optional[asyncio.Lock] = None
+
+        @functools.wraps(func)
+        async def wrapper() -> T:
+            nonlocal lock
+
+            if time.monotonic() < state["expires_at"]:
+                return state["value"]
+
+            # Created lazily so the lock binds to the running event loop
+            if lock is None:
+                lock = asyncio.Lock()
+
+            async with lock:
+                # Another caller may have refreshed the value while we waited
+                if time.monotonic() < state["expires_at"]:
+                    return state["value"]
+
+                value = await func()
+                state["value"] = value
+                state["expires_at"] = time.monotonic() + ttl
+                return value
+
+        def invalidate() -> None:
+            """Discard the cached value."""
+            state["expires_at"] = 0.0
+
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
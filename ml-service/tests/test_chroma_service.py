@@ -0,0 +1,140 @@
+"""Unit tests for services.chroma_service."""
+
+import pytest
+
+from services.chroma_service import ChromaService
+
+
+@pytest.fixture
+def service(tmp_path):
+    return ChromaService(persist_directory=str(tmp_path), num_results=5)
+
+
+def test_best_chunk_per_file_keeps_nearest_chunk_in_distance_order():
+    metadatas = [
+        {"file_id": "a"},
+        {"file_id": "b"},
+        {"file_id": "a"},
+        {"file_id": "c"},
+        {"file_id": "b"},
+    ]
+    distances = [0.5, 0.4, 0.1, 0.9, 0.2]
+
+    keep, unique_count = ChromaService._best_chunk_per_file(metadatas, distances)
+
+    assert keep == [2, 4, 3]
+    assert unique_count == 3
+
+
+def test_best_chunk_per_file_skips_chunks_without_file_id():
+    metadatas = [{"other": 1}, None, {"file_id": 7}, {"file_id": 7}]
+    distances = [0.0, 0.0, 0.3, 0.3]
+
+    keep, unique_count = ChromaService._best_chunk_per_file(metadatas, distances)
+
+    # Ties keep the earlier candidate
+    assert keep == [2]
+    assert unique_count == 1
+    assert ChromaService._best_chunk_per_file([{}], [0.1]) == ([], 0)
+
+
+def test_content_hash_ignores_metadata_key_order_and_stored_hash():
+    text = "Document text"
+    digest = ChromaService.compute_content_hash(text, {"a": 1, "b": 2})
+
+    assert ChromaService.compute_content_hash(text, {"b": 2, "a": 1}) == digest
+    assert ChromaService.compute_content_hash(
+        text, {"a": 1, "b": 2, ChromaService.CONTENT_HASH_KEY: "stale"}
+    ) == digest
+    assert ChromaService.compute_content_hash(text, {"a": 1, "b": 3}) != digest
+    assert ChromaService.compute_content_hash("Other text", {"a": 1, "b": 2}) != digest
+
+
+def test_find_unchanged_skips_only_identical_documents(service):
+    service.add_documents(
+        document_ids=["doc_1", "doc_2"],
+        texts=["First", "Second"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0]],
+        metadatas=[{"file_id": 1}, {"file_id": 2}],
+    )
+
+    unchanged = service.find_unchanged([
+        ("doc_1", "First", {"file_id": 1}),
+        ("doc_2", "Second, edited", {"file_id": 2}),
+        ("doc_3", "Third", {"file_id": 3}),
+    ])
+
+    assert unchanged == {"doc_1"}
+    assert service.has_same_content("doc_1", "First", {"file_id": 1})
+    assert not service.has_same_content("doc_1", "First", {"file_id": 99})
+    assert service.find_unchanged([]) == set()
+
+
+def test_content_hash_is_not_returned_to_callers(service):
+    service.add_document("doc_1", "First", [1.0, 0.0], {"file_id": 1})
+
+    results = service.search_similar([1.0, 0.0])
+
+    assert results["metadatas"] == [{"file_id": 1}]
+    assert service.get_document("doc_1")["metadata"] == {"file_id": 1}
+
+
+def test_search_returns_one_chunk_per_file_nearest_first(service):
+    service.add_documents(
+        document_ids=["a_far", "a_near", "b"],
+        texts=["A far", "A near", "B"],
+        embeddings=[[0.0, 1.0], [1.0, 0.05], [1.0, 0.5]],
+        metadatas=[{"file_id": "a"}, {"file_id": "a"}, {"file_id": "b"}],
+    )
+
+    results = service.search_similar([1.0, 0.0])
+
+    assert results["documents"] == ["A near", "B"]
+    assert results["count"] == 2
+
+
+def test_result_cache_is_cleared_by_writes_and_returns_copies(tmp_path):
+    service = ChromaService(persist_directory=str(tmp_path), result_cache_size=4)
+    service.add_document("doc_1", "First", [1.0, 0.0], {"file_id": 1})
+
+    first = service.search_similar([1.0, 0.0])
+    first["documents"].clear()
+    first["metadatas"].clear()
+    assert service.search_similar([1.0, 0.0])["documents"] == ["First"]
+
+    service.add_document("doc_2", "Second", [1.0, 0.01], {"file_id": 2})
+    assert service.search_similar([1.0, 0.0])["count"] == 2
+
+
+def test_reopening_keeps_the_collection_index_parameters(tmp_path):
+    ChromaService(persist_directory=str(tmp_path), similarity_metric="cosine", hnsw_m=16)
+
+    reopened = ChromaService(
+        persist_directory=str(tmp_path), similarity_metric="ip", hnsw_m=32
+    )
+
+    assert reopened.similarity_metric == "cosine"
+    assert reopened.hnsw_config["M"] == 16
+    assert reopened.collection.metadata["hnsw:space"] == "cosine"
+
+
+def test_auto_configure_hnsw_picks_size_tier():
+    assert ChromaService.auto_configure_hnsw(100)["M"] == 16
+    assert ChromaService.auto_configure_hnsw(50_000)["M"] == 24
+    assert ChromaService.auto_configure_hnsw(5_000_000)["M"] == 32
+
+
+def test_exact_rerank_handles_stored_vectors_that_are_not_unit_length(tmp_path):
+    service = ChromaService(persist_directory=str(tmp_path), exact_rerank=True)
+    # Written directly, like vectors stored before embeddings were normalized
+    service.collection.upsert(
+        ids=["long", "near"],
+        documents=["Long but off-axis", "Short and aligned"],
+        embeddings=[[30.0, 40.0], [0.1, 0.0]],
+        metadatas=[{"file_id": "long"}, {"file_id": "near"}],
+    )
+
+    results = service.search_similar([1.0, 0.0])
+
+    assert results["documents"] == ["Short and aligned", "Long but off-axis"]
+    assert results["distances"] == pytest.approx([0.0, 0.4], abs=1e-6)
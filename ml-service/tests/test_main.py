@@ -0,0 +1,68 @@
+"""Unit tests for request models and helpers of app.main."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app import main
+from app.main import BatchDocumentRequest, SearchRequest, _normalize_query
+
+
+@pytest.mark.parametrize("query", ["   ", "\t\n", "\x1c\x1d", " "])
+def test_search_query_that_normalizes_to_empty_is_rejected(query):
+    with pytest.raises(ValidationError):
+        SearchRequest(query=query)
+
+
+def test_search_query_keeps_case_and_collapses_whitespace():
+    request = SearchRequest(query="  Find   NASA\treports ")
+
+    assert _normalize_query(request.query) == "Find NASA reports"
+
+
+def test_batch_with_repeated_document_id_is_rejected():
+    documents = [
+        {"document_id": "doc_1", "text": "First"},
+        {"document_id": "doc_2", "text": "Second"},
+        {"document_id": "doc_1", "text": "First, again"},
+    ]
+
+    with pytest.raises(ValidationError, match="doc_1"):
+        BatchDocumentRequest(documents=documents)
+
+    assert len(BatchDocumentRequest(documents=documents[:2]).documents) == 2
+
+
+def test_failed_search_cancels_its_query_enhancement(monkeypatch):
+    enhancement_cancelled = asyncio.Event()
+
+    async def embed(query):
+        return [1.0, 0.0]
+
+    async def enhance(query, query_embedding):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            enhancement_cancelled.set()
+            raise
+
+    class FailingChroma:
+        def search_similar(self, **kwargs):
+            raise RuntimeError("index unavailable")
+
+    monkeypatch.setattr(main.embedding_batcher, "submit", embed)
+    monkeypatch.setattr(main, "_enhance_search_query", enhance)
+    monkeypatch.setattr(main, "chroma_service", FailingChroma(), raising=False)
+    monkeypatch.setattr(main.settings, "enable_query_enhancement", True)
+    monkeypatch.setattr(main.settings, "query_enhancement_min_words", 1)
+
+    async def run():
+        with pytest.raises(HTTPException) as error:
+            await main.search_documents(SearchRequest(query="find reports"))
+        # Checked before asyncio.run() cancels leftover tasks on exit
+        await asyncio.sleep(0)
+        return error.value.status_code, enhancement_cancelled.is_set()
+
+    assert asyncio.run(run()) == (500, True)
@@ -0,0 +1,127 @@
+"""Unit tests for services.micro_batcher."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from services.micro_batcher import MicroBatcher
+
+
+class RecordingProcessor:
+    """Batch processor that doubles items and records every batch it receives."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.batches: List[List[int]] = []
+        self.delay = delay
+
+    async def __call__(self, items: List[int]) -> List[int]:
+        self.batches.append(list(items))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return [item * 2 for item in items]
+
+
+def test_concurrent_submissions_share_one_batch():
+    processor = RecordingProcessor()
+
+    async def run():
+        batcher = MicroBatcher(processor, max_batch_size=8, max_wait_ms=50)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(run()) == [0, 2, 4, 6, 8]
+    assert processor.batches == [[0, 1, 2, 3, 4]]
+
+
+def test_full_batches_are_flushed_at_max_batch_size():
+    processor = RecordingProcessor()
+
+    async def run():
+        batcher = MicroBatcher(processor, max_batch_size=2, max_wait_ms=1000)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(5))), timeout=5
+        )
+        await batcher.stop()
+        return results
+
+    assert asyncio.run(run()) == [0, 2, 4, 6, 8]
+    assert [len(batch) for batch in processor.batches] == [2, 2, 1]
+
+
+def test_invalid_item_fails_only_its_own_caller():
+    batches: List[List[int]] = []
+
+    async def process(items: List[int]) -> List[int]:
+        batches.append(list(items))
+        if 3 in items:
+            raise ValueError("bad item")
+        return items
+
+    async def run():
+        batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=1000)
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(4)), return_exceptions=True
+        )
+        await batcher.stop()
+        return results
+
+    first, second, third, fourth = asyncio.run(run())
+    assert (first, second, third) == (0, 1, 2)
+    assert isinstance(fourth, ValueError)
+    # The failed batch is retried one item at a time
+    assert batches[0] == [0, 1, 2, 3]
+    assert sorted(batches[1:]) == [[0], [1], [2], [3]]
+
+
+def test_result_count_mismatch_fails_the_batch():
+    async def process(items: List[int]) -> List[int]:
+        return []
+
+    async def run():
+        batcher = MicroBatcher(process, max_batch_size=2, max_wait_ms=1000)
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(2)), return_exceptions=True
+        )
+        await batcher.stop()
+        return results
+
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(run()))
+
+
+def test_stop_fails_items_of_a_partially_collected_batch():
+    processor = RecordingProcessor()
+
+    async def run():
+        batcher = MicroBatcher(processor, max_batch_size=10, max_wait_ms=10_000)
+        batcher.start()
+        pending = [asyncio.ensure_future(batcher.submit(i)) for i in range(3)]
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(batcher.stop(), timeout=1)
+        return await asyncio.wait_for(
+            asyncio.gather(*pending, return_exceptions=True), timeout=1
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert processor.batches == []
+
+
+def test_stop_waits_for_in_flight_batches():
+    processor = RecordingProcessor(delay=0.05)
+
+    async def run():
+        batcher = MicroBatcher(processor, max_batch_size=2, max_wait_ms=0)
+        pending = [asyncio.ensure_future(batcher.submit(i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+        return await asyncio.gather(*pending)
+
+    assert asyncio.run(run()) == [0, 2]
+
+
+@pytest.mark.parametrize("kwargs", [{"max_batch_size": 0}, {"max_wait_ms": -1}])
+def test_invalid_limits_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        MicroBatcher(RecordingProcessor(), **kwargs)
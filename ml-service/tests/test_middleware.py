@@ -0,0 +1,107 @@
+"""Unit tests for app.middleware."""
+
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middleware import GZipRequestMiddleware, GZipResponseMiddleware
+
+MAX_BODY_SIZE = 1024
+LARGE_TEXT = "search result " * 200
+
+
+async def echo(request: Request) -> PlainTextResponse:
+    body = await request.body()
+    return PlainTextResponse(
+        body.decode(),
+        headers={"x-received-length": request.headers["content-length"]},
+    )
+
+
+async def large(request: Request) -> PlainTextResponse:
+    return PlainTextResponse(LARGE_TEXT)
+
+
+async def stream(request: Request) -> StreamingResponse:
+    async def events():
+        yield f"data: {LARGE_TEXT}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@pytest.fixture
+def client():
+    app = Starlette(
+        routes=[
+            Route("/echo", echo, methods=["POST"]),
+            Route("/large", large),
+            Route("/generate/stream", stream),
+        ]
+    )
+    app.add_middleware(GZipRequestMiddleware, max_body_size=MAX_BODY_SIZE)
+    app.add_middleware(GZipResponseMiddleware, minimum_size=500)
+    return TestClient(app)
+
+
+def post_gzip(client: TestClient, body: bytes):
+    return client.post("/echo", content=body, headers={"Content-Encoding": "gzip"})
+
+
+def test_gzip_body_is_decompressed(client):
+    response = post_gzip(client, gzip.compress(b"hello world"))
+
+    assert response.status_code == 200
+    assert response.text == "hello world"
+    assert response.headers["x-received-length"] == "11"
+
+
+def test_plain_body_passes_through(client):
+    response = client.post("/echo", content=b"plain")
+
+    assert response.status_code == 200
+    assert response.text == "plain"
+
+
+def test_decompression_bomb_is_rejected(client):
+    bomb = gzip.compress(b"\0" * (MAX_BODY_SIZE * 100))
+    assert len(bomb) < MAX_BODY_SIZE
+
+    assert post_gzip(client, bomb).status_code == 413
+
+
+def test_oversized_compressed_body_is_rejected(client):
+    assert post_gzip(client, b"\0" * (MAX_BODY_SIZE + 1)).status_code == 413
+
+
+def test_truncated_gzip_body_is_rejected(client):
+    body = gzip.compress(b"hello world")
+
+    assert post_gzip(client, body[:-6]).status_code == 400
+
+
+def test_malformed_gzip_body_is_rejected(client):
+    assert post_gzip(client, b"not gzip at all").status_code == 400
+
+
+def test_large_responses_are_compressed(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == LARGE_TEXT
+
+
+def test_event_streams_pass_through_uncompressed(client):
+    response = client.get("/generate/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == f"data: {LARGE_TEXT}\n\n"
+
+
+def test_non_positive_limit_is_rejected():
+    with pytest.raises(ValueError):
+        GZipRequestMiddleware(Starlette(), max_body_size=0)
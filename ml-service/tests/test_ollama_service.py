@@ -0,0 +1,94 @@
+"""Unit tests for the async embedding paths of services.ollama_service."""
+
+import asyncio
+import json
+from typing import List
+
+import httpx
+
+from services.ollama_service import OllamaService, _ConcurrencyLimiter
+
+
+def make_service(supports_embed: bool, paths: List[str]) -> OllamaService:
+    """Build a service backed by a fake Ollama that records requested paths."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        body = json.loads(request.content)
+
+        if request.url.path == "/api/embed" and supports_embed:
+            return httpx.Response(200, json={"embeddings": [[0.6, 0.8] for _ in body["input"]]})
+        if request.url.path == "/api/embeddings":
+            return httpx.Response(200, json={"embedding": [3.0, 4.0]})
+        return httpx.Response(404, text="404 page not found")
+
+    return OllamaService(
+        host="http://ollama.test",
+        embedding_cache_size=0,
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_single_and_batched_embeddings_match():
+    paths: List[str] = []
+    service = make_service(supports_embed=True, paths=paths)
+
+    async def run():
+        return await service.aembed_text("text"), await service.aembed_texts(["text", "other"])
+
+    single, batch = asyncio.run(run())
+
+    assert single == batch[0] == [0.6, 0.8]
+    assert paths == ["/api/embed", "/api/embed"]
+
+
+def test_missing_embed_endpoint_is_remembered_and_legacy_vectors_normalized():
+    paths: List[str] = []
+    service = make_service(supports_embed=False, paths=paths)
+
+    async def run():
+        first = await service.aembed_texts(["a", "b"])
+        second = await service.aembed_texts(["c"])
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == [[0.6, 0.8], [0.6, 0.8]]
+    assert second == [[0.6, 0.8]]
+    assert paths.count("/api/embed") == 1
+    assert paths.count("/api/embeddings") == 3
+
+
+def test_model_not_found_does_not_disable_embed_endpoint():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"error": "model not found"})
+
+    service = OllamaService(
+        host="http://ollama.test",
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    asyncio.run(service.aembed_text("text"))
+
+    assert service._embed_endpoint_supported
+
+
+def test_concurrency_limiter_caps_holders():
+    limiter = _ConcurrencyLimiter(2)
+    unlimited = _ConcurrencyLimiter(0)
+    active = peak = 0
+
+    async def hold():
+        nonlocal active, peak
+        async with limiter, unlimited:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def run():
+        await asyncio.gather(*(hold() for _ in range(6)))
+
+    asyncio.run(run())
+
+    assert peak == 2
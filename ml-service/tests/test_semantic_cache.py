@@ -0,0 +1,75 @@
+"""Unit tests for services.semantic_cache."""
+
+import pytest
+
+from services.semantic_cache import SemanticCache
+
+
+def test_exact_key_hit_without_embedding():
+    cache = SemanticCache(max_size=4)
+    cache.put([1.0, 0.0], "value", key="query")
+
+    assert cache.get(key="query") == "value"
+    assert cache.get(key="other") is None
+
+
+def test_similarity_threshold_decides_hits():
+    cache = SemanticCache(max_size=4, threshold=0.95)
+    cache.put([1.0, 0.0], "value")
+
+    # Scale does not matter, only the angle between embeddings
+    assert cache.get([10.0, 0.1]) == "value"
+    # cos(45 degrees) is about 0.707, below the threshold
+    assert cache.get([1.0, 1.0]) is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SemanticCache(max_size=2, threshold=0.99)
+    cache.put([1.0, 0.0, 0.0], "a", key="a")
+    cache.put([0.0, 1.0, 0.0], "b", key="b")
+
+    # Touch "a" so "b" becomes the least recently used entry
+    assert cache.get(key="a") == "a"
+    cache.put([0.0, 0.0, 1.0], "c", key="c")
+
+    assert len(cache) == 2
+    assert cache.get(key="b") is None
+    assert cache.get([0.0, 1.0, 0.0]) is None
+    assert cache.get(key="a") == "a"
+    assert cache.get(key="c") == "c"
+
+
+def test_put_with_existing_key_replaces_entry():
+    cache = SemanticCache(max_size=2)
+    cache.put([1.0, 0.0], "old", key="query")
+    cache.put([0.0, 1.0], "new", key="query")
+
+    assert len(cache) == 1
+    assert cache.get(key="query") == "new"
+    assert cache.get([0.0, 1.0]) == "new"
+
+
+def test_mismatched_and_zero_embeddings_are_ignored():
+    cache = SemanticCache(max_size=2)
+    cache.put([1.0, 0.0], "value")
+    cache.put([1.0, 0.0, 0.0], "other")
+    cache.put([0.0, 0.0], "zero")
+
+    assert len(cache) == 1
+    assert cache.get([1.0, 0.0, 0.0]) is None
+    assert cache.get([0.0, 0.0]) is None
+
+
+def test_clear_removes_all_entries():
+    cache = SemanticCache(max_size=2)
+    cache.put([1.0, 0.0], "value", key="query")
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.get([1.0, 0.0], key="query") is None
+
+
+@pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"threshold": 1.5}])
+def test_invalid_settings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        SemanticCache(**kwargs)
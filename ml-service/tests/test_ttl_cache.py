@@ -0,0 +1,82 @@
+"""Unit tests for services.ttl_cache."""
+
+import asyncio
+
+import pytest
+
+from services import ttl_cache
+from services.ttl_cache import async_ttl_cache
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_value_is_reused_until_ttl_expires(clock):
+    calls = []
+
+    @async_ttl_cache(ttl=2.0)
+    async def fetch() -> int:
+        calls.append(clock.now)
+        return len(calls)
+
+    async def run():
+        first = await fetch()
+        clock.now += 1.9
+        second = await fetch()
+        clock.now += 0.2
+        third = await fetch()
+        return first, second, third
+
+    assert asyncio.run(run()) == (1, 1, 2)
+    assert len(calls) == 2
+
+
+def test_invalidate_forces_a_refresh(clock):
+    calls = []
+
+    @async_ttl_cache(ttl=60.0)
+    async def fetch() -> int:
+        calls.append(clock.now)
+        return len(calls)
+
+    async def run():
+        first = await fetch()
+        fetch.invalidate()
+        return first, await fetch()
+
+    assert asyncio.run(run()) == (1, 2)
+
+
+def test_concurrent_callers_share_one_call():
+    calls = []
+
+    @async_ttl_cache(ttl=60.0)
+    async def fetch() -> str:
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*(fetch() for _ in range(10)))
+
+    assert asyncio.run(run()) == ["ok"] * 10
+    assert len(calls) == 1
+
+
+def test_negative_ttl_is_rejected():
+    with pytest.raises(ValueError):
+        async_ttl_cache(ttl=-1.0)